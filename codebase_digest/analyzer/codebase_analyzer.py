@@ -1,15 +1,63 @@
 """Main codebase analyzer that orchestrates parsing and analysis."""
 
+import mmap
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import reduce
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Type
 
-from ..models import CodebaseAnalysis
+from ..models import CodebaseAnalysis, Symbol, Import, CallRelation, DomainEntity
 from ..parser import PythonParser, JavaScriptParser, BaseParser
 from .flow_analyzer import FlowAnalyzer
 from .metrics_analyzer import MetricsAnalyzer
 
 
+# Common entry point patterns
+_ENTRY_PATTERNS = frozenset({
+    'main.py', 'app.py', 'server.py', 'run.py', 'start.py',
+    'manage.py', '__main__.py', 'wsgi.py', 'asgi.py',
+    'index.js', 'server.js', 'app.js', 'main.js'
+})
+
+# Only __init__.py files this close to the root (e.g. pkg/__init__.py) are inspected
+_PACKAGE_ENTRY_MAX_DEPTH = 2
+
+# Below this many files, process pool start-up costs more than it saves
+_PARALLEL_PARSE_MIN_FILES = 50
+
+
+@dataclass
+class ParsedFile:
+    """Everything extracted from one source file."""
+    file_path: Path
+    symbols: List[Symbol] = field(default_factory=list)
+    imports: List[Import] = field(default_factory=list)
+    calls: List[CallRelation] = field(default_factory=list)
+    entities: List[DomainEntity] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _parse_one(task: Tuple[Type[BaseParser], Path]) -> ParsedFile:
+    """Parse a single file. Module-level so it can run in worker processes."""
+    parser_class, file_path = task
+    result = ParsedFile(file_path)
+    
+    try:
+        parser = parser_class(file_path)
+        result.symbols = parser.parse_symbols()
+        result.imports = parser.parse_imports()
+        result.calls = parser.parse_calls()
+        result.entities = parser.parse_domain_entities()
+    except Exception as e:
+        result.error = str(e)
+    
+    return result
+
+
 class CodebaseAnalyzer:
     """Main analyzer that coordinates parsing and analysis of a codebase."""
     
@@ -24,6 +72,11 @@ class CodebaseAnalyzer:
             '.pytest_cache', '.mypy_cache', '.tox', 'venv', 'env',
             '.venv', 'dist', 'build', '*.egg-info', '.DS_Store'
         }
+        
+        # Split patterns once so the walker's ignore test is a set probe plus a C-level endswith
+        self._ignore_exact = frozenset(p for p in self.ignore_patterns if not p.startswith('*'))
+        self._ignore_suffixes = tuple(p[1:] for p in self.ignore_patterns if p.startswith('*'))
+        self._source_suffixes = tuple(self.parsers)
     
     def _register_parsers(self):
         """Register available parsers."""
@@ -37,111 +90,152 @@ class CodebaseAnalyzer:
         for ext in js_extensions:
             self.parsers[ext] = JavaScriptParser
     
-    def analyze(self) -> CodebaseAnalysis:
-        """Perform complete codebase analysis."""
+    def analyze(self, include_flows: bool = True) -> CodebaseAnalysis:
+        """Perform complete codebase analysis.
+        
+        Pass include_flows=False to skip execution flow analysis when only
+        metrics and structure are needed.
+        """
         analysis = CodebaseAnalysis(root_path=self.root_path)
         
         # Find all relevant files
-        files = self._find_source_files()
+        files, directories = self._find_source_files()
         analysis.total_files = len(files)
+        # Suffix of every source file, in the same order as files
+        suffixes = [
+            os.path.splitext(filename)[1]
+            for _, filenames in directories for filename in filenames
+        ]
         
         # Parse each file
-        for file_path in files:
-            self._parse_file(file_path, analysis)
+        self._parse_files(files, analysis)
+        
+        if analysis.parse_errors:
+            sys.stderr.write(''.join(
+                f"Error parsing {file_path}: {error}\n" for file_path, error in analysis.parse_errors
+            ))
+        
+        # Cache symbol attributes for the analyzers below
+        analysis.index_symbols()
         
         # Detect entry points
         analysis.entry_points = self._detect_entry_points(files)
         
         # Analyze execution flows
-        flow_analyzer = FlowAnalyzer(analysis)
-        analysis.execution_flows = flow_analyzer.analyze_flows()
+        if include_flows:
+            flow_analyzer = FlowAnalyzer(analysis)
+            analysis.execution_flows = flow_analyzer.analyze_flows()
         
         # Calculate metrics
         metrics_analyzer = MetricsAnalyzer(analysis)
         analysis.total_lines = metrics_analyzer.count_total_lines(files)
-        analysis.languages = metrics_analyzer.detect_languages(files)
+        analysis.languages = metrics_analyzer.detect_languages(files, suffixes=suffixes)
         analysis.complexity_score = metrics_analyzer.calculate_complexity()
         
         # Build directory tree
-        analysis.directory_tree = self._build_directory_tree()
+        analysis.directory_tree = self._build_directory_tree(directories)
         
         return analysis
     
-    def _find_source_files(self) -> List[Path]:
-        """Find all source files in the codebase."""
+    def _find_source_files(self) -> Tuple[List[Path], List[Tuple[Tuple[str, ...], List[str]]]]:
+        """Find all source files in the codebase.
+        
+        Also returns (rel_parts, source_filenames) for every visited directory,
+        so the directory tree can be built without walking the disk again.
+        """
         files = []
+        directories = []
         
-        for root, dirs, filenames in os.walk(self.root_path):
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if not self._should_ignore(d)]
-            
-            for filename in filenames:
-                file_path = Path(root) / filename
-                if self._is_source_file(file_path) and not self._should_ignore(filename):
-                    files.append(file_path)
+        for dir_path, rel_parts, filenames in self._walk_source_tree(self.root_path):
+            directories.append((rel_parts, filenames))
+            files.extend(Path(os.path.join(dir_path, filename)) for filename in filenames)
         
-        return files
+        return files, directories
     
-    def _is_source_file(self, file_path: Path) -> bool:
-        """Check if file is a source code file."""
-        return file_path.suffix in self.parsers
-    
-    def _should_ignore(self, name: str) -> bool:
-        """Check if file/directory should be ignored."""
-        for pattern in self.ignore_patterns:
-            if pattern.startswith('*'):
-                if name.endswith(pattern[1:]):
-                    return True
-            elif name == pattern or name.startswith(pattern):
-                return True
-        return False
-    
-    def _parse_file(self, file_path: Path, analysis: CodebaseAnalysis):
-        """Parse a single file and add results to analysis."""
-        parser_class = self.parsers.get(file_path.suffix)
-        if not parser_class:
-            return
+    def _walk_source_tree(self, root) -> Iterator[Tuple[str, Tuple[str, ...], List[str]]]:
+        """Walk root top-down with os.scandir, skipping ignored entries.
         
-        try:
-            parser = parser_class(file_path)
-            
-            # Parse symbols
-            symbols = parser.parse_symbols()
-            analysis.symbols.extend(symbols)
-            
-            # Parse imports
-            imports = parser.parse_imports()
-            analysis.imports.extend(imports)
+        Yields (dir_path, rel_parts, source_filenames) for every visited
+        directory, in the same order as os.walk. Directory entries reuse the
+        file type reported by readdir, so no extra stat() is issued per entry.
+        """
+        stack = [(os.fspath(root), ())]
+        
+        # Bound locally: these tests run once per directory entry
+        ignore_exact = self._ignore_exact
+        ignore_suffixes = self._ignore_suffixes
+        source_suffixes = self._source_suffixes
+        
+        while stack:
+            dir_path, rel_parts = stack.pop()
+            subdirs = []
+            filenames = []
             
-            # Parse calls
-            calls = parser.parse_calls()
-            analysis.call_relations.extend(calls)
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name in ignore_exact or name.endswith(ignore_suffixes):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append((entry.path, rel_parts + (name,)))
+                        elif entry.is_file() and name.endswith(source_suffixes):
+                            filenames.append(name)
+            except OSError:
+                continue
             
-            # Parse domain entities
-            entities = parser.parse_domain_entities()
-            analysis.domain_entities.extend(entities)
+            yield dir_path, rel_parts, filenames
             
-        except Exception as e:
-            # Log error but continue processing
-            print(f"Error parsing {file_path}: {e}")
+            # Push in reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+    
+    def _parse_files(self, files: List[Path], analysis: CodebaseAnalysis):
+        """Parse all files, in worker processes when there are enough of them."""
+        tasks = [(self.parsers[file_path.suffix], file_path)
+                 for file_path in files if file_path.suffix in self.parsers]
+        
+        results = None
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(tasks) >= _PARALLEL_PARSE_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(
+                        _parse_one, tasks, chunksize=max(1, len(tasks) // (workers * 4))
+                    ))
+            except (OSError, BrokenProcessPool):
+                # No usable process pool here - parse serially instead
+                results = None
+        
+        if results is None:
+            results = map(_parse_one, tasks)
+        
+        for result in results:
+            self._add_parsed_file(result, analysis)
+    
+    def _add_parsed_file(self, parsed: ParsedFile, analysis: CodebaseAnalysis):
+        """Merge one file's parse results into the analysis."""
+        analysis.symbols.extend(parsed.symbols)
+        analysis.imports.extend(parsed.imports)
+        analysis.call_relations.extend(parsed.calls)
+        analysis.domain_entities.extend(parsed.entities)
+        
+        if parsed.error is not None:
+            # Record error but continue processing; reported once in analyze()
+            analysis.parse_errors.append((parsed.file_path, parsed.error))
     
     def _detect_entry_points(self, files: List[Path]) -> List[Path]:
         """Detect likely entry points in the codebase."""
         entry_points = []
-        
-        # Common entry point patterns
-        entry_patterns = [
-            'main.py', 'app.py', 'server.py', 'run.py', 'start.py',
-            'manage.py', '__main__.py', 'wsgi.py', 'asgi.py',
-            'index.js', 'server.js', 'app.js', 'main.js'
-        ]
+        root_depth = len(self.root_path.parts)
         
         for file_path in files:
-            if file_path.name in entry_patterns:
+            name = file_path.name  # Path.name is recomputed on every access
+            if name in _ENTRY_PATTERNS:
                 entry_points.append(file_path)
-            elif file_path.name == '__init__.py':
+            elif name == '__init__.py':
                 # Check if it's a package entry point
-                if self._is_package_entry_point(file_path):
+                if (len(file_path.parts) - root_depth <= _PACKAGE_ENTRY_MAX_DEPTH
+                        and self._is_package_entry_point(file_path)):
                     entry_points.append(file_path)
         
         return entry_points
@@ -149,34 +243,25 @@ class CodebaseAnalyzer:
     def _is_package_entry_point(self, init_file: Path) -> bool:
         """Check if __init__.py file is a package entry point."""
         try:
-            content = init_file.read_text(encoding='utf-8')
-            # Simple heuristic: contains main execution logic
-            return 'if __name__' in content or 'main(' in content
-        except:
+            with open(init_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                # Search the mapped bytes directly instead of decoding the file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    # Simple heuristic: contains main execution logic
+                    return content.find(b'if __name__') != -1 or content.find(b'main(') != -1
+        except (OSError, ValueError):
             return False
     
-    def _build_directory_tree(self) -> Dict:
-        """Build a directory tree structure."""
+    def _build_directory_tree(self, directories: List[Tuple[Tuple[str, ...], List[str]]]) -> Dict:
+        """Build a directory tree structure from the directories found while walking."""
         tree = {}
         
-        for root, dirs, files in os.walk(self.root_path):
-            # Filter ignored directories
-            dirs[:] = [d for d in dirs if not self._should_ignore(d)]
-            
-            rel_path = Path(root).relative_to(self.root_path)
-            
+        for rel_parts, source_files in directories:
             # Build nested structure
-            current = tree
-            for part in rel_path.parts:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
+            current = reduce(lambda node, part: node.setdefault(part, {}), rel_parts, tree)
             
             # Add files
-            source_files = [f for f in files 
-                          if self._is_source_file(Path(root) / f) 
-                          and not self._should_ignore(f)]
-            
             if source_files:
                 current['_files'] = source_files
         
@@ -1,32 +1,94 @@
 """Execution flow analysis."""
 
-import networkx as nx
-from typing import List, Set, Dict
+import re
+from typing import List, Set, Dict, FrozenSet, Tuple
 from pathlib import Path
 
 from ..models import CodebaseAnalysis, ExecutionFlow, CallRelation
 
 
+_ENTRY_NAMES = frozenset({'main', '__main__', 'app', 'run', 'start'})
+_ENTRY_DECORATORS = frozenset({'@app.route', '@router.get', '@router.post', '@api.route', '@bp.route'})
+_CRUD_WORDS = frozenset({'create', 'read', 'get', 'update', 'delete', 'save', 'find'})
+_AUTH_WORDS = frozenset({
+    'login', 'logout', 'authenticate', 'authorize', 'verify',
+    'validate', 'token', 'session', 'permission'
+})
+
+# Splits snake_case, camelCase and dotted names into words
+_NAME_TOKEN = re.compile(r'[A-Z]?[a-z0-9]+|[A-Z]+(?![a-z])')
+
+
 class FlowAnalyzer:
     """Analyzes execution flows through the codebase."""
     
     def __init__(self, analysis: CodebaseAnalysis):
         self.analysis = analysis
         self.call_graph = self._build_call_graph()
+        self._files_by_caller = self._build_files_index()
+        self._trace_cache: Dict[str, Tuple[Tuple[str, ...], FrozenSet[Path]]] = {}
+        self._entry_functions, self._crud_functions, self._auth_functions = self._classify_symbols()
     
-    def _build_call_graph(self) -> nx.DiGraph:
-        """Build a directed graph of function calls."""
-        graph = nx.DiGraph()
+    def _build_call_graph(self) -> Dict[str, Dict[str, None]]:
+        """Build a directed graph of function calls.
+        
+        Maps each caller to its callees. Callees are dict keys so repeated
+        calls collapse into one edge while first-call order is kept.
+        """
+        graph: Dict[str, Dict[str, None]] = {}
         
         for call in self.analysis.call_relations:
-            caller_name = call.caller_symbol.name
-            graph.add_edge(caller_name, call.callee_name, 
-                          caller_file=call.caller_symbol.file_path,
-                          callee_file=call.callee_file,
-                          line_number=call.line_number)
+            graph.setdefault(call.caller_symbol.name, {})[call.callee_name] = None
         
         return graph
     
+    def _build_files_index(self) -> Dict[str, Set[Path]]:
+        """Map each caller name to the files its calls touch."""
+        files_by_caller: Dict[str, Set[Path]] = {}
+        
+        for call in self.analysis.call_relations:
+            files = files_by_caller.setdefault(call.caller_symbol.name, set())
+            files.add(call.caller_symbol.file_path)
+            if call.callee_file:
+                files.add(call.callee_file)
+        
+        return files_by_caller
+    
+    def _classify_symbols(self) -> Tuple[List[str], List[str], List[str]]:
+        """Sort symbols into entry, CRUD and auth candidates in a single pass."""
+        main_functions = []
+        route_handlers = []
+        crud_functions = []
+        auth_functions = []
+        
+        # Names like __init__ or get repeat across classes; tokenize each once
+        verdicts: Dict[str, Tuple[bool, bool]] = {}
+        
+        if not self.analysis.symbols_indexed():
+            self.analysis.index_symbols()
+        
+        for name, decorators in zip(self.analysis._symbol_names, self.analysis._symbol_decorators):
+            if name in _ENTRY_NAMES:
+                main_functions.append(name)
+            if decorators and not _ENTRY_DECORATORS.isdisjoint(decorators):
+                route_handlers.append(name)
+            
+            verdict = verdicts.get(name)
+            if verdict is None:
+                words = {word.lower() for word in _NAME_TOKEN.findall(name)}
+                verdict = verdicts[name] = (
+                    not words.isdisjoint(_CRUD_WORDS),
+                    not words.isdisjoint(_AUTH_WORDS),
+                )
+            is_crud, is_auth = verdict
+            if is_crud:
+                crud_functions.append(name)
+            if is_auth:
+                auth_functions.append(name)
+        
+        # Main functions first, then HTTP route handlers
+        return main_functions + route_handlers, crud_functions, auth_functions
+    
     def analyze_flows(self) -> List[ExecutionFlow]:
         """Analyze execution flows starting from entry points."""
         flows = []
@@ -46,63 +108,59 @@ class FlowAnalyzer:
     
     def _find_entry_functions(self) -> List[str]:
         """Find functions that are likely entry points."""
-        entry_functions = []
-        
-        # Look for main functions
-        for symbol in self.analysis.symbols:
-            if symbol.name in ['main', '__main__', 'app', 'run', 'start']:
-                entry_functions.append(symbol.name)
-        
-        # Look for HTTP route handlers
-        for symbol in self.analysis.symbols:
-            if any(decorator in ['@app.route', '@router.get', '@router.post', 
-                               '@api.route', '@bp.route'] 
-                   for decorator in symbol.decorators):
-                entry_functions.append(symbol.name)
-        
-        return entry_functions
+        return list(self._entry_functions)
     
     def _trace_execution_flow(self, entry_function: str) -> ExecutionFlow:
         """Trace execution flow from an entry function."""
         if entry_function not in self.call_graph:
             return None
         
+        flow_steps, files_involved = self._trace_steps(entry_function)
+        
+        if len(flow_steps) > 1:
+            return ExecutionFlow(
+                name=f"{entry_function}_flow",
+                entry_point=entry_function,
+                steps=list(flow_steps),
+                files_involved=set(files_involved),
+                description=f"Execution flow starting from {entry_function}"
+            )
+        
+        return None
+    
+    def _trace_steps(self, entry_function: str) -> Tuple[Tuple[str, ...], FrozenSet[Path]]:
+        """Walk the call graph from an entry function, memoized per entry name.
+        
+        Entry lists often repeat a name (several `run` or `main` symbols), and
+        every repeat would otherwise walk the same subtree again.
+        """
+        cached = self._trace_cache.get(entry_function)
+        if cached is not None:
+            return cached
+        
         # Use DFS to trace the flow
         visited = set()
         flow_steps = []
         files_involved = set()
+        stack = [(entry_function, 0)]
         
-        def dfs(func_name: str, depth: int = 0):
-            if depth > 10 or func_name in visited:  # Prevent infinite recursion
-                return
+        while stack:
+            func_name, depth = stack.pop()
+            if depth > 10 or func_name in visited:  # Depth limit and cycle guard
+                continue
             
             visited.add(func_name)
             flow_steps.append(func_name)
             
             # Add file information
-            for call in self.analysis.call_relations:
-                if call.caller_symbol.name == func_name:
-                    files_involved.add(call.caller_symbol.file_path)
-                    if call.callee_file:
-                        files_involved.add(call.callee_file)
+            files_involved |= self._files_by_caller.get(func_name, set())
             
-            # Continue tracing
-            if func_name in self.call_graph:
-                for successor in self.call_graph.successors(func_name):
-                    dfs(successor, depth + 1)
-        
-        dfs(entry_function)
+            # Continue tracing, pushed in reverse to keep successor order
+            successors = self.call_graph.get(func_name, ())
+            stack.extend((successor, depth + 1) for successor in reversed(successors))
         
-        if len(flow_steps) > 1:
-            return ExecutionFlow(
-                name=f"{entry_function}_flow",
-                entry_point=entry_function,
-                steps=flow_steps,
-                files_involved=files_involved,
-                description=f"Execution flow starting from {entry_function}"
-            )
-        
-        return None
+        result = self._trace_cache[entry_function] = (tuple(flow_steps), frozenset(files_involved))
+        return result
     
     def _detect_common_patterns(self) -> List[ExecutionFlow]:
         """Detect common execution patterns."""
@@ -122,13 +180,7 @@ class FlowAnalyzer:
     
     def _detect_crud_pattern(self) -> ExecutionFlow:
         """Detect CRUD (Create, Read, Update, Delete) patterns."""
-        crud_functions = []
-        
-        for symbol in self.analysis.symbols:
-            name_lower = symbol.name.lower()
-            if any(crud_word in name_lower for crud_word in 
-                   ['create', 'read', 'get', 'update', 'delete', 'save', 'find']):
-                crud_functions.append(symbol.name)
+        crud_functions = list(self._crud_functions)
         
         if len(crud_functions) >= 3:  # At least 3 CRUD operations
             return ExecutionFlow(
@@ -143,14 +195,7 @@ class FlowAnalyzer:
     
     def _detect_auth_pattern(self) -> ExecutionFlow:
         """Detect authentication/authorization patterns."""
-        auth_functions = []
-        
-        for symbol in self.analysis.symbols:
-            name_lower = symbol.name.lower()
-            if any(auth_word in name_lower for auth_word in 
-                   ['login', 'logout', 'authenticate', 'authorize', 'verify', 
-                    'validate', 'token', 'session', 'permission']):
-                auth_functions.append(symbol.name)
+        auth_functions = list(self._auth_functions)
         
         if len(auth_functions) >= 2:
             return ExecutionFlow(
@@ -0,0 +1,61 @@
+"""Helpers for working with plain adjacency-dict call graphs."""
+
+from typing import Dict, Iterable, List
+
+
+def strongly_connected_components(graph: Dict[str, Iterable[str]]) -> List[List[str]]:
+    """Find strongly connected components with an iterative Tarjan search.
+
+    Nodes that only appear as successors are included as well. Components
+    are returned in reverse topological order: every component comes after
+    all of the components it has edges into.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    counter = 0
+
+    for start in graph:
+        if start in index:
+            continue
+
+        index[start] = lowlink[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(graph.get(start, ())))]
+
+        while work:
+            node, successors = work[-1]
+
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, ()))))
+                    break
+                if succ in on_stack and index[succ] < lowlink[node]:
+                    lowlink[node] = index[succ]
+            else:
+                # All successors done - close the node
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
@@ -1,9 +1,58 @@
 """Metrics and statistics analyzer."""
 
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Dict
+from typing import List, Optional, Set, Dict
 
 from ..models import CodebaseAnalysis
+from .graph_utils import strongly_connected_components
+
+
+_LANGUAGE_MAP = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.cs': 'C#',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.scala': 'Scala'
+}
+
+# Whitespace that bytes.strip() removes, minus the newline itself
+_BLANK_BYTES = b' \t\r\x0b\x0c'
+_READ_CHUNK = 1 << 20
+
+
+def _count_non_blank_lines(file_path: Path) -> int:
+    """Count non-blank lines in a file without decoding it."""
+    total = 0
+    carry = b''
+    
+    try:
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(_READ_CHUNK)
+                if not chunk:
+                    break
+                # With whitespace deleted, a blank line is an empty segment
+                lines = (carry + chunk.translate(None, _BLANK_BYTES)).split(b'\n')
+                carry = lines.pop()  # May be a partial line
+                total += len(lines) - lines.count(b'')
+    except OSError:
+        return 0
+    
+    return total + (1 if carry else 0)
 
 
 class MetricsAnalyzer:
@@ -14,46 +63,23 @@ class MetricsAnalyzer:
     
     def count_total_lines(self, files: List[Path]) -> int:
         """Count total lines of code."""
-        total_lines = 0
-        
-        for file_path in files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    total_lines += sum(1 for line in f if line.strip())
-            except:
-                continue
+        if not files:
+            return 0
         
-        return total_lines
+        # Reads release the GIL, so a thread pool overlaps the I/O waits
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(_count_non_blank_lines, files))
     
-    def detect_languages(self, files: List[Path]) -> Set[str]:
-        """Detect programming languages in the codebase."""
-        languages = set()
-        
-        language_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.jsx': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.tsx': 'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.cs': 'C#',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.scala': 'Scala'
-        }
-        
-        for file_path in files:
-            lang = language_map.get(file_path.suffix)
-            if lang:
-                languages.add(lang)
-        
-        return languages
+    def detect_languages(self, files: List[Path], suffixes: Optional[List[str]] = None) -> Set[str]:
+        """Detect programming languages in the codebase.
+        
+        suffixes may carry the already-known suffix of each file in files,
+        to skip recomputing them.
+        """
+        if suffixes is None:
+            suffixes = [file_path.suffix for file_path in files]
+        return {_LANGUAGE_MAP[suffix] for suffix in suffixes if suffix in _LANGUAGE_MAP}
     
     def calculate_complexity(self) -> float:
         """Calculate a simple complexity score."""
@@ -87,44 +113,47 @@ class MetricsAnalyzer:
                 call_graph[caller_name] = []
             call_graph[caller_name].append(call.callee_name)
         
-        # Find maximum depth using DFS
-        max_depth = 0
-        
-        def dfs(func: str, visited: Set[str], depth: int) -> int:
-            if func in visited or func not in call_graph:
-                return depth
-            
-            visited.add(func)
-            local_max = depth
-            
-            for callee in call_graph[func]:
-                local_max = max(local_max, dfs(callee, visited.copy(), depth + 1))
-            
-            return local_max
+        # Longest path over the condensation of the call graph. Tarjan emits
+        # components callees-first, so each depth only looks at finished ones.
+        components = strongly_connected_components(call_graph)
+        component_of = {}
+        for comp_id, component in enumerate(components):
+            for func in component:
+                component_of[func] = comp_id
+        
+        # Depth counted in nodes; a cycle contributes one extra hop back into itself
+        node_depth = []
+        for comp_id, component in enumerate(components):
+            cyclic = len(component) > 1 or component[0] in call_graph.get(component[0], ())
+            deepest_callee = 1 if cyclic else 0
+            for func in component:
+                for callee in call_graph.get(func, ()):
+                    callee_comp = component_of[callee]
+                    if callee_comp != comp_id and node_depth[callee_comp] > deepest_callee:
+                        deepest_callee = node_depth[callee_comp]
+            node_depth.append(len(component) + deepest_callee)
+        
+        # Depth is reported in call edges
+        return max(node_depth, default=1) - 1
+    
+    def get_file_statistics(self, files: List[Path], suffixes: Optional[List[str]] = None) -> Dict[str, int]:
+        """Get detailed file statistics.
         
-        for func in call_graph:
-            max_depth = max(max_depth, dfs(func, set(), 0))
+        suffixes may carry the already-known suffix of each file in files.
+        """
+        if suffixes is None:
+            suffixes = [file_path.suffix for file_path in files]
+        counts = Counter(suffixes)
         
-        return max_depth
-    
-    def get_file_statistics(self, files: List[Path]) -> Dict[str, int]:
-        """Get detailed file statistics."""
         stats = {
             'total_files': len(files),
-            'python_files': 0,
-            'javascript_files': 0,
-            'typescript_files': 0,
-            'other_files': 0
+            'python_files': counts['.py'],
+            'javascript_files': counts['.js'] + counts['.jsx'],
+            'typescript_files': counts['.ts'] + counts['.tsx'],
         }
-        
-        for file_path in files:
-            if file_path.suffix == '.py':
-                stats['python_files'] += 1
-            elif file_path.suffix in ['.js', '.jsx']:
-                stats['javascript_files'] += 1
-            elif file_path.suffix in ['.ts', '.tsx']:
-                stats['typescript_files'] += 1
-            else:
-                stats['other_files'] += 1
+        stats['other_files'] = (
+            stats['total_files'] - stats['python_files']
+            - stats['javascript_files'] - stats['typescript_files']
+        )
         
         return stats
\ No newline at end of file
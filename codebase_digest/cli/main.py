@@ -8,7 +8,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from ..analyzer import CodebaseAnalyzer
-from ..exporters import HTMLExporter, MarkdownExporter, JSONExporter, GraphExporter, ReadmeExporter
+from ..exporters import ExportContext, HTMLExporter, MarkdownExporter, JSONExporter, ReadmeExporter
 
 app = typer.Typer(
     name="codebase-digest",
@@ -24,7 +24,8 @@ def build(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output directory (default: .digest)"),
     format: str = typer.Option("all", "--format", "-f", help="Output format: html, markdown, json, or all"),
     graph: bool = typer.Option(False, "--graph", help="Generate interactive call graph visualization"),
-    graph_depth: Optional[int] = typer.Option(None, "--graph-depth", help="Limit graph to N hops from entrypoints (default: no limit)")
+    graph_depth: Optional[int] = typer.Option(None, "--graph-depth", help="Limit graph to N hops from entrypoints (default: no limit)"),
+    gzip_graph: bool = typer.Option(False, "--gzip-graph", help="Write the call graph gzip-compressed (callgraph.html.gz)")
 ):
     """Build complete codebase analysis and generate reports."""
     
@@ -68,19 +69,22 @@ def build(
     else:
         formats_to_generate = [format]
     
+    # Counts, top imports and relative paths shared by every report format
+    export_context = ExportContext.from_analysis(analysis)
+    
     for fmt in formats_to_generate:
         if fmt == "html":
-            html_exporter = HTMLExporter(analysis)
+            html_exporter = HTMLExporter(analysis, export_context)
             html_exporter.export(output / "report.html")
             console.print(f"[green]✓[/green] Generated HTML report: {output / 'report.html'}")
         
         elif fmt == "markdown":
-            md_exporter = MarkdownExporter(analysis)
+            md_exporter = MarkdownExporter(analysis, export_context)
             md_exporter.export(output / "architecture.md")
             console.print(f"[green]✓[/green] Generated Markdown report: {output / 'architecture.md'}")
         
         elif fmt == "json":
-            json_exporter = JSONExporter(analysis)
+            json_exporter = JSONExporter(analysis, export_context)
             json_exporter.export(output / "entities.json")
             console.print(f"[green]✓[/green] Generated JSON data: {output / 'entities.json'}")
         
@@ -99,9 +103,11 @@ def build(
     
     # Always generate interactive call graph
     try:
+        from ..exporters import GraphExporter
+        
         graph_exporter = GraphExporter(analysis, max_depth=graph_depth)
-        graph_exporter.export(output / "callgraph.html")
-        console.print(f"[green]✓[/green] Generated interactive call graph: {output / 'callgraph.html'}")
+        graph_path = graph_exporter.export(output / "callgraph.html", compress=gzip_graph)
+        console.print(f"[green]✓[/green] Generated interactive call graph: {graph_path}")
         
         # Show graph statistics
         stats = graph_exporter.get_graph_stats()
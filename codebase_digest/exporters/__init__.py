@@ -1,9 +1,24 @@
-"""Export modules for generating reports and documentation."""
+"""Export modules for generating reports and documentation.
 
+Exporters filter symbols with ``symbol.type == 'function'`` and friends and
+count imports by ``imp.module``; both fields are interned by the models
+(see ``Symbol.__post_init__`` and ``Import.__post_init__``), so those
+comparisons and hashes stay cheap on large analyses.
+"""
+
+from .context import ExportContext
 from .html_exporter import HTMLExporter
 from .markdown_exporter import MarkdownExporter
 from .json_exporter import JSONExporter
-from .graph_exporter import GraphExporter
 from .readme_exporter import ReadmeExporter
 
-__all__ = ["HTMLExporter", "MarkdownExporter", "JSONExporter", "GraphExporter", "ReadmeExporter"]
\ No newline at end of file
+__all__ = ["ExportContext", "HTMLExporter", "MarkdownExporter", "JSONExporter", "GraphExporter", "ReadmeExporter"]
+
+
+def __getattr__(name):
+    # GraphExporter pulls in networkx and pyvis, which are slow to import;
+    # load it only when first requested
+    if name == "GraphExporter":
+        from .graph_exporter import GraphExporter
+        return GraphExporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
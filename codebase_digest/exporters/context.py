@@ -0,0 +1,51 @@
+"""Shared, precomputed data for the report exporters."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ..models import CodebaseAnalysis
+
+
+@dataclass
+class ExportContext:
+    """Analysis-derived data that several exporters need.
+
+    Built once per analysis so that exporting several formats does not
+    recount symbols and imports or re-resolve file paths for each one.
+    """
+    analysis: CodebaseAnalysis
+    counts_by_type: Dict[str, int]
+    top_imports: List[Tuple[str, int]]
+    generated_at: datetime
+    rel_paths: Dict[Path, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_analysis(cls, analysis: CodebaseAnalysis) -> "ExportContext":
+        """Precompute the shared data for an analysis."""
+        return cls(
+            analysis=analysis,
+            counts_by_type=Counter(s.type for s in analysis.symbols),
+            top_imports=Counter(imp.module for imp in analysis.imports).most_common(10),
+            generated_at=datetime.now(timezone.utc),
+        )
+
+    @property
+    def generated_at_iso(self) -> str:
+        """Generation time as a timezone-aware ISO 8601 string."""
+        return self.generated_at.isoformat()
+
+    @property
+    def generated_at_human(self) -> str:
+        """Generation time in local time, for display."""
+        return self.generated_at.astimezone().strftime('%Y-%m-%d %H:%M:%S')
+
+    def rel(self, path: Path) -> str:
+        """Path relative to the project root, memoized per file."""
+        rel = self.rel_paths.get(path)
+        if rel is None:
+            rel = str(path.relative_to(self.analysis.root_path))
+            self.rel_paths[path] = rel
+        return rel
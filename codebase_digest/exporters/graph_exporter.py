@@ -1,12 +1,99 @@
 """Interactive call graph exporter for developer inspection."""
 
+import gzip
+import json
+import logging
+import re
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, TextIO, Tuple
 import networkx as nx
 from pyvis.network import Network
 
 from ..models import CodebaseAnalysis, Symbol
 
+try:
+    import orjson  # Optional: faster JSON encoder for large graphs
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Node styling by symbol type
+_NODE_COLORS = {
+    'function': '#3b82f6',  # blue
+    'method': '#3b82f6',    # blue
+    'class': '#10b981',     # green
+    'file': '#6b7280'       # gray
+}
+_NODE_SIZES = {
+    'class': 25,
+    'function': 20,
+    'method': 15,
+    'file': 30
+}
+
+# Entrypoint scoring signals, matched against lower-cased names
+_PRIMARY_ENTRY_FILES = frozenset({"main.py", "app.py", "__main__.py"})
+_SECONDARY_ENTRY_FILES = frozenset({"cli.py", "server.py", "run.py"})
+_PRIMARY_ENTRY_SYMBOLS = frozenset({"main", "run", "start"})
+_SECONDARY_ENTRY_SYMBOLS = frozenset({"app", "cli", "server"})
+
+
+def _dump_json(data: Any, f: TextIO) -> None:
+    """Write compact JSON to an open file - the payload is read by vis.js, not by people."""
+    if orjson is None:
+        json.dump(data, f, separators=(',', ':'))
+        return
+    
+    payload = orjson.dumps(data)
+    buffer = getattr(f, 'buffer', None)
+    if buffer is not None:
+        # orjson already produces UTF-8: hand the bytes to the binary layer
+        # instead of decoding them only for the text layer to re-encode
+        f.flush()
+        buffer.write(payload)
+    else:
+        f.write(payload.decode('utf-8'))
+
+
+def _largest_weak_component(G: nx.DiGraph) -> set:
+    """Return the nodes of the largest weakly connected component.
+
+    Components are found in node order with a plain BFS over the raw
+    successor/predecessor dicts, and the scan stops as soon as the nodes not
+    yet seen could no longer form a larger component. Ties go to the
+    component found first, as with max() over weakly_connected_components.
+    """
+    succ, pred = G._succ, G._pred
+    seen = set()
+    best = set()
+    remaining = len(G)
+    for start in succ:
+        if start in seen:
+            continue
+        component = {start}
+        frontier = [start]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                for neighbor in succ[node]:
+                    if neighbor not in component:
+                        component.add(neighbor)
+                        next_frontier.append(neighbor)
+                for neighbor in pred[node]:
+                    if neighbor not in component:
+                        component.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        seen |= component
+        remaining -= len(component)
+        if len(component) > len(best):
+            best = component
+        if remaining <= len(best):
+            break
+    return best
+
 
 class GraphExporter:
     """Exports call graph as interactive HTML visualization."""
@@ -14,134 +101,138 @@ class GraphExporter:
     def __init__(self, analysis: CodebaseAnalysis, max_depth: int = None):
         self.analysis = analysis
         self.max_depth = max_depth
+        self._entrypoint_nodes: List[str] = []
+        self._stats_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
         self.graph = self._build_networkx_graph()
     
     def _build_networkx_graph(self) -> nx.DiGraph:
         """Build NetworkX graph from analysis data."""
         G = nx.DiGraph()
         
-        print(f"Building graph with {len(self.analysis.symbols)} symbols and {len(self.analysis.call_relations)} call relations")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Building graph with %d symbols and %d call relations",
+                         len(self.analysis.symbols), len(self.analysis.call_relations))
         
         # Build symbol index for fast lookup
-        symbol_index = {}
+        symbol_index = defaultdict(list)
         for symbol in self.analysis.symbols:
             # Index by base name for resolution
-            base_name = symbol.name.split('.')[-1]  # Handle Class.method -> method
-            symbol_index.setdefault(base_name, []).append(symbol)
-            # Also index by full name
-            symbol_index.setdefault(symbol.name, []).append(symbol)
+            base_name = symbol.name.rpartition('.')[2]  # Handle Class.method -> method
+            symbol_index[base_name].append(symbol)
+            # Also index by full name, unless that is the same key
+            if base_name != symbol.name:
+                symbol_index[symbol.name].append(symbol)
+        
+        # Relative path and file name per file - most symbols share a file
+        root_path = self.analysis.root_path
+        file_meta = {}
+        for symbol in self.analysis.symbols:
+            file_path = symbol.file_path
+            if file_path not in file_meta:
+                file_meta[file_path] = (file_path.relative_to(root_path), file_path.name,
+                                        file_path.name.lower())
+        
+        # Node ids keyed by (file, name); call relations carry their own
+        # Symbol copies, so identity can't be used for the lookup
+        node_ids = self._node_id_cache = {}
+        for symbol in self.analysis.symbols:
+            node_ids[(symbol.file_path, symbol.name)] = self._node_id(symbol)
         
-        # Add nodes for symbols
+        # Add nodes for symbols in one batch
+        nodes_batch = []
         for symbol in self.analysis.symbols:
-            node_id = self._node_id(symbol)
-            rel_path = symbol.file_path.relative_to(self.analysis.root_path)
+            node_id = node_ids[(symbol.file_path, symbol.name)]
+            rel_path, file_name, file_lc = file_meta[symbol.file_path]
             
             # Determine node color and size based on type
-            color = self._get_node_color(symbol.type)
-            size = self._get_node_size(symbol.type)
-            
-            G.add_node(
-                node_id,
-                label=symbol.name,
-                title=f"{symbol.type}: {symbol.name}\nFile: {rel_path}\nLine: {symbol.line_number}",
-                color=color,
-                size=size,
-                symbol_type=symbol.type,
-                file_path=str(rel_path),
-                line_number=symbol.line_number,
-                docstring=symbol.docstring or "",
-                group=str(symbol.file_path.name)  # Group by file for clustering
-            )
-        
-        # Debug: Print some call relations
-        print("Sample call relations:")
-        for i, call in enumerate(self.analysis.call_relations[:5]):
-            print(f"  {call.caller_symbol.name} -> {call.callee_name} (in {call.caller_symbol.file_path.name})")
+            symbol_type = symbol.type
+            nodes_batch.append((node_id, {
+                "label": symbol.name,
+                "title": f"{symbol_type}: {symbol.name}\nFile: {rel_path}\nLine: {symbol.line_number}",
+                "color": _NODE_COLORS.get(symbol_type, '#6b7280'),
+                "size": _NODE_SIZES.get(symbol_type, 20),
+                "symbol_type": symbol_type,
+                "file_path": str(rel_path),
+                "line_number": symbol.line_number,
+                "docstring": symbol.docstring or "",
+                "group": file_name,  # Group by file for clustering
+                # Lower-cased names for entrypoint scoring
+                "_file_lc": file_lc,
+                "_sym_lc": symbol.name.lower()
+            }))
+        G.add_nodes_from(nodes_batch)
+        
+        # Debug: Log some call relations
+        if debug:
+            logger.debug("Sample call relations:")
+            for call in self.analysis.call_relations[:5]:
+                logger.debug("  %s -> %s (in %s)", call.caller_symbol.name, call.callee_name,
+                             call.caller_symbol.file_path.name)
         
         # Add edges for call relationships - now trivial with symbol-aware relations
-        edges_added = 0
-        unresolved_calls = []
+        edges_batch = []
+        unresolved_sample: Dict[str, None] = {}  # First 10 unique misses, for debugging
+        resolve_cache: Dict[Tuple[Path, str], Optional[str]] = {}
+        # Every strategy needs the base or the full callee name in the index,
+        # so anything else (builtins, third-party calls) can be rejected early
+        known_callees = frozenset(symbol_index)
         
         for call in self.analysis.call_relations:
-            # Caller is now directly available as a symbol
-            caller_id = self._node_id(call.caller_symbol)
-            callee_id = None
-            
-            # Normalize callee name - strip object prefixes
-            callee_base = call.callee_name.split(".")[-1]  # app.run -> run, self.validate -> validate
-            
-            # Strategy 1: Direct match with normalized name
-            if callee_base in symbol_index:
-                # Find best match (prefer same file, then any file)
-                candidates = symbol_index[callee_base]
-                
-                # Prefer same file as caller
-                same_file_candidates = [s for s in candidates if s.file_path == call.caller_symbol.file_path]
-                if same_file_candidates:
-                    symbol = same_file_candidates[0]
-                    callee_id = self._node_id(symbol)
-                else:
-                    # Use first available candidate
-                    symbol = candidates[0]
-                    callee_id = self._node_id(symbol)
+            callee_name = call.callee_name
+            if callee_name.rpartition(".")[2] not in known_callees and callee_name not in known_callees:
+                if debug and len(unresolved_sample) < 10:
+                    unresolved_sample[callee_name] = None
+                continue
             
-            # Strategy 2: Constructor calls (Class() -> Class.__init__ or just Class)
-            elif call.callee_name in symbol_index:
-                candidates = symbol_index[call.callee_name]
-                # Look for class first
-                class_candidates = [s for s in candidates if s.type == 'class']
-                if class_candidates:
-                    symbol = class_candidates[0]
-                    callee_id = self._node_id(symbol)
-                else:
-                    symbol = candidates[0]
-                    callee_id = self._node_id(symbol)
+            # Caller is now directly available as a symbol; every id in
+            # node_ids is a node, so no has_node checks are needed below
+            caller = call.caller_symbol
+            caller_id = node_ids.get((caller.file_path, caller.name))
             
-            # Strategy 3: Method calls (handle Class.method patterns)
-            elif "." in call.callee_name:
-                parts = call.callee_name.split(".")
-                if len(parts) == 2:
-                    class_name, method_name = parts
-                    # Look for the method in the class
-                    method_key = f"{class_name}.{method_name}"
-                    if method_key in symbol_index:
-                        symbol = symbol_index[method_key][0]
-                        callee_id = self._node_id(symbol)
+            # Calls from one file to one name always resolve the same way
+            resolve_key = (caller.file_path, callee_name)
+            if resolve_key in resolve_cache:
+                callee_id = resolve_cache[resolve_key]
+            else:
+                callee_id = resolve_cache[resolve_key] = self._resolve_callee(
+                    callee_name, caller.file_path, symbol_index, node_ids
+                )
             
             # Add edge if callee found
-            if callee_id and G.has_node(caller_id) and G.has_node(callee_id):
-                G.add_edge(
-                    caller_id,
-                    callee_id,
-                    title=f"{call.caller_symbol.name} → {call.callee_name}",
-                    color="#666666",
-                    width=2
-                )
-                edges_added += 1
-            else:
-                unresolved_calls.append(call.callee_name)
-        
-        print(f"Added {edges_added} edges to graph")
+            if callee_id and caller_id:
+                edges_batch.append((caller_id, callee_id, {
+                    "title": f"{call.caller_symbol.name} → {callee_name}",
+                    "color": "#666666",
+                    "width": 2
+                }))
+            elif debug and len(unresolved_sample) < 10:
+                unresolved_sample[callee_name] = None
+        
+        G.add_edges_from(edges_batch)
+        logger.debug("Added %d edges to graph", len(edges_batch))
         
         # Debug: Show unresolved calls
-        if unresolved_calls:
-            print("Unresolved calls (first 10):")
-            for callee in list(set(unresolved_calls))[:10]:
-                print(f"  - {callee}")
+        if unresolved_sample:
+            logger.debug("Unresolved calls (first 10):")
+            for callee in unresolved_sample:
+                logger.debug("  - %s", callee)
         
         # Apply graph enhancements
-        # Remove builtin noise and isolated nodes FIRST
+        # Remove builtin noise FIRST
         G = self._remove_builtin_noise(G)
-        isolated = list(nx.isolates(G))
-        G.remove_nodes_from(isolated)
-        print(f"Removed {len(isolated)} isolated nodes")
-        
-        # Keep only largest connected component
-        components = list(nx.weakly_connected_components(G))
-        if components:
-            largest = max(components, key=len)
+        
+        # Keep only largest connected component. Isolated nodes drop out with
+        # the other small components; a lone isolate can only win when the
+        # graph has no edges, in which case nothing is kept
+        largest = _largest_weak_component(G)
+        if len(largest) == 1:
+            node = next(iter(largest))
+            if not G._succ[node] and not G._pred[node]:
+                largest = set()
+        if len(largest) < len(G):
             G = G.subgraph(largest).copy()
-            print(f"Kept largest component with {len(largest)} nodes")
+        logger.debug("Kept largest component with %d nodes", len(largest))
         
         # THEN enhance visualization (entrypoint marking happens after noise removal)
         self._enhance_graph_visualization(G)
@@ -152,43 +243,97 @@ class GraphExporter:
         
         return G
     
+    def _resolve_callee(self, callee_name: str, caller_file: Path,
+                        symbol_index: Dict[str, List[Symbol]],
+                        node_ids: Dict[Tuple[Path, str], str]) -> Optional[str]:
+        """Resolve a call target to a node id, or None if it is not a project symbol."""
+        # Normalize callee name - strip object prefixes
+        callee_base = callee_name.rpartition(".")[2]  # app.run -> run, self.validate -> validate
+        
+        # Strategy 1: Direct match with normalized name
+        if callee_base in symbol_index:
+            # Find best match (prefer same file, then any file)
+            candidates = symbol_index[callee_base]
+            
+            # Prefer same file as caller
+            same_file_candidates = [s for s in candidates if s.file_path == caller_file]
+            if same_file_candidates:
+                symbol = same_file_candidates[0]
+            else:
+                # Use first available candidate
+                symbol = candidates[0]
+            return node_ids[(symbol.file_path, symbol.name)]
+        
+        # Strategy 2: Constructor calls (Class() -> Class.__init__ or just Class)
+        if callee_name in symbol_index:
+            candidates = symbol_index[callee_name]
+            # Look for class first
+            class_candidates = [s for s in candidates if s.type == 'class']
+            if class_candidates:
+                symbol = class_candidates[0]
+            else:
+                symbol = candidates[0]
+            return node_ids[(symbol.file_path, symbol.name)]
+        
+        # Strategy 3: Method calls (handle Class.method patterns)
+        if "." in callee_name:
+            parts = callee_name.split(".")
+            if len(parts) == 2:
+                class_name, method_name = parts
+                # Look for the method in the class
+                method_key = f"{class_name}.{method_name}"
+                if method_key in symbol_index:
+                    symbol = symbol_index[method_key][0]
+                    return node_ids[(symbol.file_path, symbol.name)]
+        
+        return None
+    
     def _apply_depth_filter(self, G: nx.DiGraph, max_depth: int) -> nx.DiGraph:
         """Filter graph to show only nodes within max_depth from detected entrypoints."""
-        # Find detected entrypoints (nodes marked as entrypoints)
-        entrypoints = [node for node in G.nodes() if G.nodes[node].get("entrypoint", False)]
-        
-        if not entrypoints:
-            # Fallback: use probabilistic detection if no entrypoints marked yet
-            entrypoints = self._detect_entrypoints(G)
+        # Entrypoints detected (and marked) by _enhance_graph_visualization
+        entrypoints = self._entrypoint_nodes
         
         if not entrypoints:
-            # Final fallback: return full graph if no entrypoints found
-            print("No entrypoints detected for depth filtering - returning full graph")
+            # Fallback: return full graph if no entrypoints found
+            logger.debug("No entrypoints detected for depth filtering - returning full graph")
             return G
         
         # Collect all nodes within max_depth from any entrypoint using BFS
         nodes_to_keep = set()
+        keep_add = nodes_to_keep.add
+        succ = G._succ  # Raw adjacency dict; skips the successors() iterator wrapper
+        n_total = len(G)
         for entry in entrypoints:
-            if not G.has_node(entry):
+            if entry not in succ:
                 continue
                 
             # BFS to find nodes within max_depth
             visited = {entry}
-            queue = [(entry, 0)]
+            queue = deque([(entry, 0)])
+            visited_add = visited.add
+            enqueue = queue.append
             
             while queue:
-                node, depth = queue.pop(0)
-                nodes_to_keep.add(node)
+                node, depth = queue.popleft()
+                keep_add(node)
                 
                 if depth < max_depth:
-                    for successor in G.successors(node):
+                    for successor in succ[node]:
                         if successor not in visited:
-                            visited.add(successor)
-                            queue.append((successor, depth + 1))
+                            visited_add(successor)
+                            enqueue((successor, depth + 1))
+            
+            # Every node is already in range - nothing left to filter
+            if len(nodes_to_keep) == n_total:
+                break
         
         # Create subgraph with only the nodes to keep
-        filtered_graph = G.subgraph(nodes_to_keep).copy()
-        print(f"Depth filter: reduced from {len(G.nodes())} to {len(filtered_graph.nodes())} nodes (depth={max_depth})")
+        if len(nodes_to_keep) == n_total:
+            filtered_graph = G
+        else:
+            filtered_graph = G.subgraph(nodes_to_keep).copy()
+        logger.debug("Depth filter: reduced from %d to %d nodes (depth=%s)",
+                     len(G), len(filtered_graph), max_depth)
         
         return filtered_graph
     
@@ -196,28 +341,25 @@ class GraphExporter:
         """Detect real execution entrypoints using weighted heuristic scoring."""
         entrypoint_candidates = []
         
-        for node in G.nodes():
-            # Parse node identifier
-            parts = node.split("::")
-            if len(parts) != 2:
-                continue
-                
-            file_name = parts[0].lower()
-            symbol_name = parts[1].lower()
+        pred = G._pred
+        for node, data in G._node.items():
+            # Names were lower-cased when the node was created
+            file_name = data["_file_lc"]
+            symbol_name = data["_sym_lc"]
             
             # Calculate weighted score
             score = 0
             
             # File-based signals
-            if file_name in ("main.py", "app.py", "__main__.py"):
+            if file_name in _PRIMARY_ENTRY_FILES:
                 score += 3
-            elif file_name in ("cli.py", "server.py", "run.py"):
+            elif file_name in _SECONDARY_ENTRY_FILES:
                 score += 2
                 
             # Symbol-based signals  
-            if symbol_name in ("main", "run", "start"):
+            if symbol_name in _PRIMARY_ENTRY_SYMBOLS:
                 score += 2
-            elif symbol_name in ("app", "cli", "server"):
+            elif symbol_name in _SECONDARY_ENTRY_SYMBOLS:
                 score += 1
                 
             # CLI bias: prefer "build" if present
@@ -225,7 +367,7 @@ class GraphExporter:
                 score += 3
                 
             # Topology signals
-            if G.in_degree(node) == 0:
+            if not pred[node]:
                 score += 1
                 
             # Only consider nodes with meaningful score
@@ -248,92 +390,98 @@ class GraphExporter:
     def _remove_builtin_noise(self, G: nx.DiGraph) -> nx.DiGraph:
         """Remove nodes that do not correspond to project symbols."""
         
-        valid_nodes = set(self._node_id(s) for s in self.analysis.symbols)
-        
-        nodes_to_remove = [n for n in G.nodes() if n not in valid_nodes]
+        valid_nodes = set(self._node_id_cache.values())
+        keep = valid_nodes.intersection(G._node)
+        logger.debug("Removed %d non-project nodes", len(G) - len(keep))
         
-        G.remove_nodes_from(nodes_to_remove)
-        print(f"Removed {len(nodes_to_remove)} non-project nodes")
-        
-        return G
+        if len(keep) == len(G):
+            return G
+        return G.subgraph(keep).copy()
     def _enhance_graph_visualization(self, G: nx.DiGraph) -> None:
         """Apply visual enhancements to make the graph more informative."""
         
         # 1. PROBABILISTIC ENTRYPOINT DETECTION
-        entrypoints = self._detect_entrypoints(G)
-        
-        for node in entrypoints:
-            if G.has_node(node):  # Ensure node still exists after noise removal
-                G.nodes[node]["color"] = "#f59e0b"  # Orange for entrypoints
-                G.nodes[node]["size"] += 12
-                G.nodes[node]["entrypoint"] = True
-        
-        print(f"Detected {len(entrypoints)} probabilistic entrypoints: {[node.split('::')[-1] for node in entrypoints[:5]]}")
-        
-        # 2. CENTRALITY WEIGHTING - Size nodes by structural importance
-        if len(G.nodes()) > 0:
-            centrality = nx.degree_centrality(G)
-            for node in G.nodes():
-                importance_boost = int(centrality[node] * 20)
-                G.nodes[node]["size"] += importance_boost
+        entrypoints = self._entrypoint_nodes = self._detect_entrypoints(G)
+        entrypoint_set = set(entrypoints)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Detected %d probabilistic entrypoints: %s", len(entrypoints),
+                         [node.split('::')[-1] for node in entrypoints[:5]])
+        
+        # 2. CENTRALITY WEIGHTING - Size nodes by structural importance.
+        # Degree centrality is (in + out degree) / (n - 1), and 1 for a lone
+        # node; computed inline and fused with the entrypoint marking
+        succ, pred = G._succ, G._pred
+        scale = 1.0 / (len(G) - 1) if len(G) > 1 else None
+        for node, attrs in G._node.items():
+            if scale is None:
+                importance_boost = 20
+            else:
+                importance_boost = int((len(succ[node]) + len(pred[node])) * scale * 20)
+            if node in entrypoint_set:
+                attrs["color"] = "#f59e0b"  # Orange for entrypoints
+                attrs["size"] += 12 + importance_boost
+                attrs["entrypoint"] = True
+            else:
+                attrs["size"] += importance_boost
                 
         # 3. EXECUTION PATH EMPHASIS - Mark immediate successors of entrypoints
+        node_attrs = G._node
         for entry in entrypoints:
-            if G.has_node(entry):
-                for successor in G.successors(entry):
-                    if G.nodes[successor].get("color") != "#f59e0b":  # Don't override entrypoints
-                        G.nodes[successor]["borderWidth"] = 3
-                        G.nodes[successor]["borderColor"] = "#f59e0b"
+            for successor in succ[entry]:
+                if successor not in entrypoint_set:  # Don't override entrypoints
+                    attrs = node_attrs[successor]
+                    attrs["borderWidth"] = 3
+                    attrs["borderColor"] = "#f59e0b"
     
     def _node_id(self, symbol: Symbol) -> str:
         """Generate consistent node ID for a symbol."""
         return f"{symbol.file_path.name}::{symbol.name}"
     
-    def _get_node_color(self, symbol_type: str) -> str:
-        """Get node color based on symbol type."""
-        colors = {
-            'function': '#3b82f6',  # blue
-            'method': '#3b82f6',    # blue
-            'class': '#10b981',     # green
-            'file': '#6b7280'       # gray
-        }
-        return colors.get(symbol_type, '#6b7280')
-    
-    def _get_node_size(self, symbol_type: str) -> int:
-        """Get node size based on symbol type."""
-        sizes = {
-            'class': 25,
-            'function': 20,
-            'method': 15,
-            'file': 30
-        }
-        return sizes.get(symbol_type, 20)
-    
-    def export(self, output_path: Path) -> None:
-        """Export graph as interactive HTML file."""
-        # Add nodes and edges from NetworkX graph
-        node_count = 0
-        edge_count = 0
-        
-        # Collect nodes and edges data
-        nodes_data = []
+    def export(self, output_path: Path, compress: bool = False) -> Path:
+        """Export graph as interactive HTML file.
+        
+        With compress=True the page is written gzip-compressed next to
+        output_path as ``<name>.html.gz``. Returns the path written.
+        """
+        # Collect nodes and edges data straight from the adjacency dicts,
+        # bypassing the NodeView/EdgeView wrappers. Nodes are shipped as one
+        # array per field and rebuilt into objects by the page script
+        ids, labels, titles, colors, sizes, groups = [], [], [], [], [], []
+        types, files, lines = [], [], []
         edges_data = []
+        entrypoint_count = 0
+        
+        # Lay bigger graphs out here so the browser only has to draw them
+        positions = None
+        if _OFFLINE_LAYOUT_NODES < len(self.graph) <= _OFFLINE_LAYOUT_MAX_NODES:
+            positions = self._compute_layout()
+        
+        for node_id, data in self.graph._node.items():
+            color = data['color']
+            if color == '#f59e0b':  # Entrypoints are drawn orange
+                entrypoint_count += 1
+            ids.append(node_id)
+            labels.append(data['label'])
+            titles.append(data['title'])
+            colors.append(color)
+            sizes.append(data['size'])
+            groups.append(data.get('group', 'default'))
+            # Read by the click handler
+            types.append(data['symbol_type'])
+            files.append(data['file_path'])
+            lines.append(data['line_number'])
+        
+        nodes_data = {
+            'ids': ids, 'labels': labels, 'titles': titles, 'colors': colors, 'sizes': sizes,
+            'groups': groups, 'types': types, 'files': files, 'lines': lines
+        }
+        if positions is not None:
+            nodes_data['xs'] = [positions[node_id][0] for node_id in ids]
+            nodes_data['ys'] = [positions[node_id][1] for node_id in ids]
         
-        for node_id, data in self.graph.nodes(data=True):
-            nodes_data.append({
-                'id': node_id,
-                'label': data['label'],
-                'title': data['title'],
-                'color': data['color'],
-                'size': data['size'],
-                'group': data.get('group', 'default'),
-                'font': {'color': '#1f2937'},
-                'shape': 'dot'
-            })
-            node_count += 1
-        
-        for source, target, data in self.graph.edges(data=True):
-            if self.graph.has_node(source) and self.graph.has_node(target):
+        for source, targets in self.graph._adj.items():
+            for target, data in targets.items():
                 edges_data.append({
                     'from': source,
                     'to': target,
@@ -342,48 +490,201 @@ class GraphExporter:
                     'width': data['width'],
                     'arrows': 'to'
                 })
-                edge_count += 1
         
-        # Calculate real component count (handle empty graph)
-        components = nx.number_weakly_connected_components(self.graph) if len(self.graph.nodes) > 0 else 0
+        node_count = len(ids)
+        edge_count = len(edges_data)
+        
+        # Calculate real component count (handle empty graph); cached for the
+        # get_graph_stats() call that usually follows
+        components = self.get_graph_stats()['components']
         
         # If no edges, create a simple layout with isolated nodes
         if edge_count == 0:
             print(f"Warning: No edges found in graph. Showing {node_count} isolated nodes.")
         
-        # Generate custom HTML with proper developer tool styling
-        html_content = self._generate_developer_html(nodes_data, edges_data, node_count, edge_count, components)
-        
+        target = output_path.with_name(output_path.name + '.gz') if compress else output_path
         try:
-            output_path.write_text(html_content, encoding='utf-8')
+            # Stream the page (and its embedded JSON) straight to disk
+            if compress:
+                f = gzip.open(target, 'wt', encoding='utf-8', compresslevel=6)
+            else:
+                f = output_path.open('w', encoding='utf-8')
+            with f:
+                self._write_developer_html(f, nodes_data, edges_data, node_count, edge_count, components,
+                                           entrypoint_count, fixed_layout=positions is not None)
             print(f"Graph saved with {node_count} nodes and {edge_count} edges")
+            return target
         except Exception as e:
             print(f"Error saving graph: {e}")
-            # Fallback: create a simple HTML file
-            self._create_fallback_html(output_path, node_count, edge_count)
+            # Fallback: replace whatever was partially written with a simple
+            # page, in the format that was asked for
+            if target != output_path:
+                target.unlink(missing_ok=True)
+            self._create_fallback_html(target, node_count, edge_count, compress=compress)
+            return target
+    
+    def _compute_layout(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Compute fixed node positions with a spring layout.
+        
+        Returns None when numpy, which spring_layout needs, is not installed;
+        the browser then runs the layout itself.
+        """
+        try:
+            pos = nx.spring_layout(self.graph, seed=42)
+        except ImportError:
+            return None
+        return {node: (int(x * _LAYOUT_SCALE), int(y * _LAYOUT_SCALE)) for node, (x, y) in pos.items()}
     
-    def _generate_developer_html(self, nodes_data: list, edges_data: list, node_count: int, edge_count: int, components: int) -> str:
-        """Generate professional developer tool HTML with split layout."""
-        import json
+    def _write_developer_html(self, f: TextIO, nodes_data: Dict[str, list], edges_data: list, node_count: int, edge_count: int, components: int,
+                              entrypoint_count: int = 0, fixed_layout: bool = False) -> None:
+        """Write professional developer tool HTML with split layout to an open file."""
+        # Big graphs skip up-front stabilization and lay out while on screen
+        large = node_count > _LARGE_GRAPH_NODES
+        # Drop per-frame extras (shadows, curved edges, default group styles) even earlier
+        heavy = node_count > _HEAVY_RENDER_NODES
+        # Edge drawing cost follows the edge count: straight lines, default arrowheads
+        heavy_edges = heavy or edge_count > _HEAVY_RENDER_EDGES
+        fields = {
+            'root_name': self.analysis.root_path.name,
+            'node_count': node_count,
+            'edge_count': edge_count,
+            'warning_html': _NO_EDGES_WARNING if edge_count == 0 else '',
+            'file_count': len(set(nodes_data['groups'])),
+            'components': components,
+            'entrypoint_count': entrypoint_count,
+            'physics_block': _PHYSICS_OFF if fixed_layout else _PHYSICS_LARGE if large else _PHYSICS_DEFAULT,
+            # Without up-front stabilization there is no stabilization event to fit on
+            'fit_event': 'afterDrawing' if fixed_layout or large else 'stabilizationIterationsDone',
+            'hide_edges_on_drag': 'true' if large else 'false',
+            'defer_edges': 'true' if large else 'false',
+            'cluster_by_file': 'true' if large else 'false',
+            'shadows': 'false' if heavy else 'true',
+            'edge_smooth': 'false' if heavy_edges else '{ type: "continuous" }',
+            'edge_arrow': '{ enabled: true }' if heavy_edges else '{ enabled: true, scaleFactor: 0.8 }',
+            'use_default_groups': 'false' if heavy else 'true',
+        }
+        f.write(_GRAPH_HEAD.format_map(fields))
+        _dump_json(nodes_data, f)
+        f.write(_GRAPH_MIDDLE)
+        _dump_json(edges_data, f)
+        f.write(_GRAPH_TAIL.format_map(fields))
+    
+    def get_graph_stats(self) -> Dict[str, Any]:
+        """Get statistics about the call graph."""
+        n = self.graph.number_of_nodes()
+        m = self.graph.number_of_edges()
+        if self._stats_cache is not None and self._stats_cache[0] == (n, m):
+            return dict(self._stats_cache[1])
         
-        nodes_json = json.dumps(nodes_data, indent=2)
-        edges_json = json.dumps(edges_data, indent=2)
+        # Handle empty graph case
+        if n == 0:
+            stats = {
+                'nodes': 0,
+                'edges': 0,
+                'density': 0.0,
+                'is_connected': False,
+                'components': 0
+            }
+        else:
+            # One component pass answers both connectivity questions
+            components = nx.number_weakly_connected_components(self.graph)
+            stats = {
+                'nodes': n,
+                'edges': m,
+                'density': m / (n * (n - 1)) if n > 1 else 0.0,  # Directed density, as nx.density
+                'is_connected': components == 1,
+                'components': components
+            }
         
-        warning_html = '''
+        # Keyed by size: a second call on the unchanged graph is O(1)
+        self._stats_cache = ((n, m), stats)
+        return dict(stats)
+    
+    def _create_fallback_html(self, output_path: Path, node_count: int, edge_count: int,
+                              compress: bool = False) -> None:
+        """Create a simple fallback HTML when pyvis fails.
+        
+        With compress=True the page is gzip-compressed before writing.
+        """
+        symbols = self.analysis.symbols
+        n = len(symbols)
+        rows = ''.join([
+            '<div class="node-item">%s (%s) - %s:%d</div>' % (s.name, s.type, s.file_path.name, s.line_number)
+            for s in symbols[:20]
+        ])
+        more = f'<div class="node-item">... and {n - 20} more</div>' if n > 20 else ''
+        fields = {
+            'root_name': self.analysis.root_path.name,
+            'node_count': node_count,
+            'edge_count': edge_count,
+            'rows': rows,
+            'more': more,
+        }
+        payload = _FALLBACK_TEMPLATE.format_map(fields).encode('utf-8')
+        if compress:
+            payload = gzip.compress(payload, compresslevel=6)
+        output_path.write_bytes(payload)
+
+
+# Graphs above this many nodes get the cheaper physics settings
+_LARGE_GRAPH_NODES = 500
+# ...and above this many, the cheaper drawing settings
+_HEAVY_RENDER_NODES = 300
+_HEAVY_RENDER_EDGES = 600
+# Between these sizes the layout is computed in Python when numpy is available.
+# spring_layout is O(n^2) per iteration; past the upper bound the browser's
+# Barnes-Hut based solver (forceAtlas2Based) is the cheaper place to do it
+_OFFLINE_LAYOUT_NODES = 200
+_OFFLINE_LAYOUT_MAX_NODES = 1000
+_LAYOUT_SCALE = 1000  # spring_layout coordinates are in [-1, 1]
+
+_PHYSICS_DEFAULT = '''{
+                enabled: true,
+                stabilization: { iterations: 300 },
+                barnesHut: {
+                    gravitationalConstant: -6000,
+                    centralGravity: 0.3,
+                    springLength: 120,
+                    springConstant: 0.08,
+                    damping: 0.1,
+                    avoidOverlap: 0.2
+                }
+            }'''
+
+_PHYSICS_OFF = '''{
+                enabled: false
+            }'''
+
+_PHYSICS_LARGE = '''{
+                enabled: true,
+                stabilization: false,
+                solver: "forceAtlas2Based",
+                forceAtlas2Based: {
+                    gravitationalConstant: -80,
+                    centralGravity: 0.005,
+                    springLength: 200,
+                    springConstant: 0.08,
+                    damping: 0.4
+                }
+            }'''
+
+# Page templates. Literal braces are doubled for str.format; the node and
+# edge JSON is streamed in between the three parts of the graph page.
+_NO_EDGES_WARNING = '''
         <div class="warning-banner">
             <div class="warning-icon">⚠️</div>
             <div>
                 <strong>No connections found</strong>
                 <p>Showing isolated nodes. This may indicate parsing issues or a codebase with minimal cross-references.</p>
             </div>
-        </div>''' if edge_count == 0 else ''
-        
-        return f'''<!DOCTYPE html>
+        </div>'''
+
+_GRAPH_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Call Graph - {self.analysis.root_path.name}</title>
+    <title>Call Graph - {root_name}</title>
     <script src="https://unpkg.com/vis-network/standalone/umd/vis-network.min.js"></script>
     <style>
         :root {{
@@ -732,7 +1033,7 @@ class GraphExporter:
 <body>
     <div class="app-shell">
         <div class="header">
-            <h1>Call Graph: {self.analysis.root_path.name}</h1>
+            <h1>Call Graph: {root_name}</h1>
             <div class="header-meta">
                 <span>Interactive visualization of function and method call relationships</span>
                 <span class="accent">{node_count} nodes</span>
@@ -788,11 +1089,11 @@ class GraphExporter:
                         </div>
                         <div class="stat-item">
                             <span class="stat-label">Files Analyzed</span>
-                            <span class="stat-value">{len(set(node['group'] for node in nodes_data))}</span>
+                            <span class="stat-value">{file_count}</span>
                         </div>
                         <div class="stat-item">
                             <span class="stat-label">Entrypoints</span>
-                            <span class="stat-value" id="entrypoint-count">-</span>
+                            <span class="stat-value" id="entrypoint-count">{entrypoint_count}</span>
                         </div>
                         <div class="stat-item">
                             <span class="stat-label">Components</span>
@@ -836,25 +1137,49 @@ class GraphExporter:
         </div>
     </div>
     
+    <script id="graph-data" type="application/json">{{"nodes":{nodes_json},"edges":{edges_json}}}</script>
     <script type="text/javascript">
-        // Initialize data
-        const nodes = new vis.DataSet({nodes_json});
-        const edges = new vis.DataSet({edges_json});
+        // Initialize data - parsed as JSON, which browsers load faster than a JS literal
+        const graphData = JSON.parse(document.getElementById('graph-data').textContent);
+        const deferEdges = {defer_edges};
+        const clusterFiles = {cluster_by_file};
+
+        // Coalesce side-panel writes into one per animation frame
+        let _pending;
+        function _mutate(fn) {{
+            _pending = fn;
+            requestAnimationFrame(() => {{ _pending && _pending(); _pending = null; }});
+        }}
+        const nodeData = graphData.nodes;
+        const nodeCount = nodeData.ids.length;
+        const nodeArray = new Array(nodeCount);
+        for (let i = 0; i < nodeCount; i++) {{
+            const node = {{
+                id: nodeData.ids[i],
+                label: nodeData.labels[i],
+                title: nodeData.titles[i],
+                color: nodeData.colors[i],
+                size: nodeData.sizes[i],
+                group: nodeData.groups[i],
+                font: {{ color: '#1f2937' }},
+                shape: 'dot',
+                // Read by the click handler; vis.js ignores unknown keys
+                _type: nodeData.types[i],
+                _file: nodeData.files[i],
+                _line: nodeData.lines[i]
+            }};
+            if (nodeData.xs) {{
+                node.x = nodeData.xs[i];
+                node.y = nodeData.ys[i];
+            }}
+            nodeArray[i] = node;
+        }}
+        const nodes = new vis.DataSet(nodeArray);
+        const edges = new vis.DataSet(deferEdges ? [] : graphData.edges);
         
         // Network options with improved physics
         const options = {{
-            physics: {{
-                enabled: true,
-                stabilization: {{ iterations: 300 }},
-                barnesHut: {{
-                    gravitationalConstant: -6000,
-                    centralGravity: 0.3,
-                    springLength: 120,
-                    springConstant: 0.08,
-                    damping: 0.1,
-                    avoidOverlap: 0.2
-                }}
-            }},
+            physics: {physics_block},
             nodes: {{
                 font: {{
                     size: 14,
@@ -862,7 +1187,7 @@ class GraphExporter:
                 }},
                 borderWidth: 2,
                 shadow: {{
-                    enabled: true,
+                    enabled: {shadows},
                     color: "rgba(0,0,0,0.2)",
                     size: 5,
                     x: 2,
@@ -872,16 +1197,16 @@ class GraphExporter:
             }},
             edges: {{
                 arrows: {{
-                    to: {{ enabled: true, scaleFactor: 0.8 }}
+                    to: {edge_arrow}
                 }},
-                smooth: {{ type: "continuous" }},
+                smooth: {edge_smooth},
                 color: {{ color: "#666666", highlight: "#3b82f6" }},
                 width: 2
             }},
             interaction: {{
                 hover: true,
                 tooltipDelay: 200,
-                hideEdgesOnDrag: false,
+                hideEdgesOnDrag: {hide_edges_on_drag},
                 hideNodesOnDrag: false
             }},
             layout: {{
@@ -889,7 +1214,10 @@ class GraphExporter:
                 randomSeed: 42
             }},
             groups: {{
-                useDefaultGroups: true
+                useDefaultGroups: {use_default_groups}
+            }},
+            configure: {{
+                enabled: false
             }}
         }};
         
@@ -898,101 +1226,99 @@ class GraphExporter:
         const data = {{ nodes: nodes, edges: edges }};
         const network = new vis.Network(container, data, options);
         
+        // Large graphs paint their nodes first and add the edges after the first frame
+        if (deferEdges) {{
+            network.once("afterDrawing", function() {{
+                edges.add(graphData.edges);
+                if (clusterFiles) {{
+                    clusterByFile();
+                }}
+            }});
+        }}
+        
         // Node click handler
+        const nodeInfo = document.getElementById('nodeInfo');
         network.on("click", function(params) {{
-            const nodeInfo = document.getElementById('nodeInfo');
-            
             if (params.nodes.length > 0) {{
                 const nodeId = params.nodes[0];
+                if (network.isCluster(nodeId)) {{
+                    // File cluster: expand it in place
+                    network.openCluster(nodeId);
+                    return;
+                }}
                 const node = nodes.get(nodeId);
                 
-                // Extract info from title
-                const titleParts = node.title.split('\\n');
-                const type = titleParts[0].split(': ')[0];
-                const name = titleParts[0].split(': ')[1];
-                const file = titleParts[1] ? titleParts[1].split(': ')[1] : 'Unknown';
-                const line = titleParts[2] ? titleParts[2].split(': ')[1] : 'Unknown';
-                
-                nodeInfo.innerHTML = `
-                    <div class="node-type">${{type}}</div>
-                    <h4>${{name}}</h4>
-                    <p><strong>File:</strong> ${{file}}</p>
-                    <p><strong>Line:</strong> ${{line}}</p>
+                const html = `
+                    <div class="node-type">${{node._type}}</div>
+                    <h4>${{node.label}}</h4>
+                    <p><strong>File:</strong> ${{node._file}}</p>
+                    <p><strong>Line:</strong> ${{node._line}}</p>
                     <p><strong>Group:</strong> ${{node.group}}</p>
                 `;
-                nodeInfo.classList.add('active');
+                _mutate(() => {{
+                    nodeInfo.innerHTML = html;
+                    nodeInfo.classList.add('active');
+                }});
             }} else {{
-                nodeInfo.innerHTML = `
-                    <div class="empty-state">
-                        <div class="empty-state-icon">👆</div>
-                        <p>Click a node to view details</p>
-                    </div>
-                `;
-                nodeInfo.classList.remove('active');
+                _mutate(() => {{
+                    nodeInfo.innerHTML = `
+                        <div class="empty-state">
+                            <div class="empty-state-icon">👆</div>
+                            <p>Click a node to view details</p>
+                        </div>
+                    `;
+                    nodeInfo.classList.remove('active');
+                }});
             }}
         }});
         
         // Physics toggle
-        let physicsEnabled = true;
+        let physicsEnabled = options.physics.enabled;
         function togglePhysics() {{
             physicsEnabled = !physicsEnabled;
             network.setOptions({{ physics: {{ enabled: physicsEnabled }} }});
         }}
         
-        // Cluster by file groups if we have many nodes
-        if (nodes.length > 20) {{
-            
+        // Cluster by file on large graphs so only one node per file is drawn
+        // at first; clicking a cluster opens it. With deferred edges this
+        // runs once the edges are in
+        function clusterByFile() {{
+            new Set(nodeData.groups).forEach(function(group) {{
+                network.cluster({{
+                    joinCondition: function(nodeOptions) {{
+                        return nodeOptions.group === group;
+                    }},
+                    clusterNodeProperties: {{
+                        id: 'cluster:' + group,
+                        label: group,
+                        title: 'File: ' + group + ' (click to expand)',
+                        color: '#6b7280',
+                        size: 30,
+                        shape: 'dot'
+                    }}
+                }});
+            }});
+        }}
+        if (clusterFiles && !deferEdges) {{
+            clusterByFile();
         }}
         
         // Auto-fit on load
-        network.once("stabilizationIterationsDone", function() {{
+        network.once("{fit_event}", function() {{
             network.fit();
-            
-            // Update dynamic statistics
-            updateGraphStats();
         }});
-        
-        function updateGraphStats() {{
-            // Count entrypoints (orange nodes)
-            const entrypoints = nodes.get({{
-                filter: function(node) {{
-                    return node.color === '#f59e0b';
-                }}
-            }});
-            document.getElementById('entrypoint-count').textContent = entrypoints.length;
-        }}
     </script>
 </body>
 </html>'''
-    
-    def get_graph_stats(self) -> Dict[str, Any]:
-        """Get statistics about the call graph."""
-        # Handle empty graph case
-        if len(self.graph.nodes) == 0:
-            return {
-                'nodes': 0,
-                'edges': 0,
-                'density': 0.0,
-                'is_connected': False,
-                'components': 0
-            }
-        
-        return {
-            'nodes': len(self.graph.nodes),
-            'edges': len(self.graph.edges),
-            'density': nx.density(self.graph) if len(self.graph.edges) > 0 else 0.0,
-            'is_connected': nx.is_weakly_connected(self.graph) if len(self.graph.nodes) > 0 else False,
-            'components': nx.number_weakly_connected_components(self.graph) if len(self.graph.nodes) > 0 else 0
-        }
-    
-    def _create_fallback_html(self, output_path: Path, node_count: int, edge_count: int) -> None:
-        """Create a simple fallback HTML when pyvis fails."""
-        html_content = f"""<!DOCTYPE html>
+
+_GRAPH_HEAD, _GRAPH_MIDDLE, _GRAPH_TAIL = re.split(r'\{(?:nodes|edges)_json\}', _GRAPH_TEMPLATE)
+
+_FALLBACK_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Call Graph - {self.analysis.root_path.name}</title>
+    <title>Call Graph - {root_name}</title>
     <style>
         body {{
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
@@ -1030,7 +1356,7 @@ class GraphExporter:
 </head>
 <body>
     <div class="header">
-        <h1>Call Graph: {self.analysis.root_path.name}</h1>
+        <h1>Call Graph: {root_name}</h1>
         <p>Graph visualization failed. Showing node list instead.</p>
     </div>
     
@@ -1040,9 +1366,8 @@ class GraphExporter:
     
     <div class="node-list">
         <h2>Detected Symbols</h2>
-        {''.join(f'<div class="node-item">{symbol.name} ({symbol.type}) - {symbol.file_path.name}:{symbol.line_number}</div>' for symbol in self.analysis.symbols[:20])}
-        {f'<div class="node-item">... and {len(self.analysis.symbols) - 20} more</div>' if len(self.analysis.symbols) > 20 else ''}
+        {rows}
+        {more}
     </div>
 </body>
 </html>"""
-        output_path.write_text(html_content, encoding='utf-8')
\ No newline at end of file
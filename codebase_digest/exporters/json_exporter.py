@@ -1,105 +1,164 @@
 """JSON data exporter."""
 
 import json
-from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ..models import CodebaseAnalysis, Symbol, Import, CallRelation, DomainEntity, ExecutionFlow
+from .context import ExportContext
+
+try:
+    import orjson  # Optional: faster JSON encoder for large analyses
+except ImportError:
+    orjson = None
+
+# Above this many symbols, export() writes records one at a time instead of
+# building the whole document in memory first
+_STREAMING_SYMBOL_THRESHOLD = 10_000
+
+
+# Output keys for each record type, in order, with a getter that fetches the
+# matching attributes in one call. File paths are read from the models'
+# precomputed file_path_str fields.
+_SYMBOL_KEYS = ("name", "type", "file_path", "line_number", "docstring",
+                "parameters", "return_type", "decorators")
+_get_symbol_fields = attrgetter("name", "type", "file_path_str", "line_number", "docstring",
+                                "parameters", "return_type", "decorators")
+
+_IMPORT_KEYS = ("module", "names", "alias", "file_path", "line_number")
+_get_import_fields = attrgetter("module", "names", "alias", "file_path_str", "line_number")
+
+_CALL_KEYS = ("caller", "callee", "caller_file", "callee_file", "line_number")
+_get_call_fields = attrgetter("caller_symbol.name", "callee_name", "caller_symbol.file_path_str",
+                              "callee_file", "line_number")
+
+_ENTITY_KEYS = ("name", "type", "file_path", "fields", "methods", "creation_points",
+                "modification_points", "validation_points")
+_get_entity_fields = attrgetter("name", "type", "file_path_str", "fields", "methods",
+                                "creation_points", "modification_points", "validation_points")
+
+_FLOW_KEYS = ("name", "entry_point", "steps", "files_involved", "description")
+_get_flow_fields = attrgetter(*_FLOW_KEYS)
+
+
+def _encode(data: Any) -> bytes:
+    """Encode one value as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, default=str).encode('utf-8')
 
 
 class JSONExporter:
     """Exports analysis results to JSON format."""
     
-    def __init__(self, analysis: CodebaseAnalysis):
+    def __init__(self, analysis: CodebaseAnalysis, context: Optional[ExportContext] = None):
         self.analysis = analysis
+        self.context = context or ExportContext.from_analysis(analysis)
     
     def export(self, output_path: Path) -> None:
         """Export analysis to JSON file."""
-        json_data = self._generate_json()
-        output_path.write_text(json.dumps(json_data, indent=2), encoding='utf-8')
+        if len(self.analysis.symbols) > _STREAMING_SYMBOL_THRESHOLD:
+            self.export_streaming(output_path)
+            return
+        
+        if orjson is None:
+            output_path.write_text(json.dumps(self._generate_json(), indent=2), encoding='utf-8')
+            return
+        
+        # orjson emits UTF-8 bytes directly, so skip the str round-trip
+        output_path.write_bytes(orjson.dumps(
+            self._generate_json(),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ))
+    
+    def export_streaming(self, output_path: Path) -> None:
+        """Export analysis to JSON file one record at a time.
+        
+        Peak memory stays flat however many records there are. Each record
+        is written compactly on its own line, without full indentation.
+        """
+        sections = (
+            ("symbols", self._serialize_symbol, self.analysis.symbols),
+            ("imports", self._serialize_import, self.analysis.imports),
+            ("call_relations", self._serialize_call_relation, self.analysis.call_relations),
+            ("domain_entities", self._serialize_domain_entity, self.analysis.domain_entities),
+            ("execution_flows", self._serialize_execution_flow, self.analysis.execution_flows),
+        )
+        
+        with output_path.open('wb') as f:
+            f.write(b'{\n')
+            f.write(b'"metadata": %s,\n' % _encode(self._generate_metadata()))
+            f.write(b'"metrics": %s,\n' % _encode(self._generate_metrics()))
+            f.write(b'"entry_points": %s,\n' % _encode([str(ep) for ep in self.analysis.entry_points]))
+            for key, serialize, records in sections:
+                f.write(b'"%s": [' % key.encode('ascii'))
+                separator = b'\n  '
+                for record in records:
+                    f.write(separator)
+                    f.write(_encode(serialize(record)))
+                    separator = b',\n  '
+                f.write(b'\n],\n' if records else b'],\n')
+            f.write(b'"directory_tree": %s\n}\n' % _encode(self.analysis.directory_tree))
     
     def _generate_json(self) -> Dict[str, Any]:
         """Generate complete JSON data structure."""
         return {
-            "metadata": {
-                "project_name": self.analysis.root_path.name,
-                "root_path": str(self.analysis.root_path),
-                "generated_at": datetime.now().isoformat(),
-                "version": "0.1.0"
-            },
-            "metrics": {
-                "total_files": self.analysis.total_files,
-                "total_lines": self.analysis.total_lines,
-                "languages": list(self.analysis.languages),
-                "complexity_score": self.analysis.complexity_score,
-                "symbol_count": len(self.analysis.symbols),
-                "import_count": len(self.analysis.imports),
-                "call_relation_count": len(self.analysis.call_relations),
-                "domain_entity_count": len(self.analysis.domain_entities),
-                "execution_flow_count": len(self.analysis.execution_flows)
-            },
+            "metadata": self._generate_metadata(),
+            "metrics": self._generate_metrics(),
             "entry_points": [str(ep) for ep in self.analysis.entry_points],
-            "symbols": [self._serialize_symbol(symbol) for symbol in self.analysis.symbols],
-            "imports": [self._serialize_import(imp) for imp in self.analysis.imports],
-            "call_relations": [self._serialize_call_relation(call) for call in self.analysis.call_relations],
-            "domain_entities": [self._serialize_domain_entity(entity) for entity in self.analysis.domain_entities],
-            "execution_flows": [self._serialize_execution_flow(flow) for flow in self.analysis.execution_flows],
+            "symbols": list(map(self._serialize_symbol, self.analysis.symbols)),
+            "imports": list(map(self._serialize_import, self.analysis.imports)),
+            "call_relations": list(map(self._serialize_call_relation, self.analysis.call_relations)),
+            "domain_entities": list(map(self._serialize_domain_entity, self.analysis.domain_entities)),
+            "execution_flows": list(map(self._serialize_execution_flow, self.analysis.execution_flows)),
             "directory_tree": self.analysis.directory_tree
         }
     
-    def _serialize_symbol(self, symbol: Symbol) -> Dict[str, Any]:
-        """Serialize a Symbol to JSON-compatible dict."""
+    def _generate_metadata(self) -> Dict[str, Any]:
+        """Generate the report metadata block."""
         return {
-            "name": symbol.name,
-            "type": symbol.type,
-            "file_path": str(symbol.file_path),
-            "line_number": symbol.line_number,
-            "docstring": symbol.docstring,
-            "parameters": symbol.parameters,
-            "return_type": symbol.return_type,
-            "decorators": symbol.decorators
+            "project_name": self.analysis.root_path.name,
+            "root_path": str(self.analysis.root_path),
+            "generated_at": self.context.generated_at_iso,
+            "version": "0.1.0"
         }
     
-    def _serialize_import(self, imp: Import) -> Dict[str, Any]:
-        """Serialize an Import to JSON-compatible dict."""
+    def _generate_metrics(self) -> Dict[str, Any]:
+        """Generate the summary metrics block."""
         return {
-            "module": imp.module,
-            "names": imp.names,
-            "alias": imp.alias,
-            "file_path": str(imp.file_path) if imp.file_path else None,
-            "line_number": imp.line_number
+            "total_files": self.analysis.total_files,
+            "total_lines": self.analysis.total_lines,
+            "languages": list(self.analysis.languages),
+            "complexity_score": self.analysis.complexity_score,
+            "symbol_count": len(self.analysis.symbols),
+            "import_count": len(self.analysis.imports),
+            "call_relation_count": len(self.analysis.call_relations),
+            "domain_entity_count": len(self.analysis.domain_entities),
+            "execution_flow_count": len(self.analysis.execution_flows)
         }
     
+    def _serialize_symbol(self, symbol: Symbol) -> Dict[str, Any]:
+        """Serialize a Symbol to JSON-compatible dict."""
+        return dict(zip(_SYMBOL_KEYS, _get_symbol_fields(symbol)))
+    
+    def _serialize_import(self, imp: Import) -> Dict[str, Any]:
+        """Serialize an Import to JSON-compatible dict."""
+        return dict(zip(_IMPORT_KEYS, _get_import_fields(imp)))
+    
     def _serialize_call_relation(self, call: CallRelation) -> Dict[str, Any]:
         """Serialize a CallRelation to JSON-compatible dict."""
-        return {
-            "caller": call.caller_symbol.name,
-            "callee": call.callee_name,
-            "caller_file": str(call.caller_symbol.file_path),
-            "callee_file": str(call.callee_file) if call.callee_file else None,
-            "line_number": call.line_number
-        }
+        data = dict(zip(_CALL_KEYS, _get_call_fields(call)))
+        data["callee_file"] = str(call.callee_file) if call.callee_file else None
+        return data
     
     def _serialize_domain_entity(self, entity: DomainEntity) -> Dict[str, Any]:
         """Serialize a DomainEntity to JSON-compatible dict."""
-        return {
-            "name": entity.name,
-            "type": entity.type,
-            "file_path": str(entity.file_path),
-            "fields": entity.fields,
-            "methods": entity.methods,
-            "creation_points": entity.creation_points,
-            "modification_points": entity.modification_points,
-            "validation_points": entity.validation_points
-        }
+        return dict(zip(_ENTITY_KEYS, _get_entity_fields(entity)))
     
     def _serialize_execution_flow(self, flow: ExecutionFlow) -> Dict[str, Any]:
         """Serialize an ExecutionFlow to JSON-compatible dict."""
-        return {
-            "name": flow.name,
-            "entry_point": flow.entry_point,
-            "steps": flow.steps,
-            "files_involved": [str(f) for f in flow.files_involved],
-            "description": flow.description
-        }
\ No newline at end of file
+        data = dict(zip(_FLOW_KEYS, _get_flow_fields(flow)))
+        data["files_involved"] = [str(f) for f in flow.files_involved]
+        return data
@@ -1,17 +1,19 @@
 """Markdown report exporter."""
 
-from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from ..models import CodebaseAnalysis
+from .context import ExportContext
 
 
 class MarkdownExporter:
     """Exports analysis results to Markdown format."""
     
-    def __init__(self, analysis: CodebaseAnalysis):
+    def __init__(self, analysis: CodebaseAnalysis, context: Optional[ExportContext] = None):
         self.analysis = analysis
+        self.context = context or ExportContext.from_analysis(analysis)
     
     def export(self, output_path: Path) -> None:
         """Export analysis to Markdown file."""
@@ -24,7 +26,7 @@ class MarkdownExporter:
 
 **Codebase Analysis Report**
 
-*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*Generated on {self.context.generated_at_human}*
 
 ## 📊 Summary
 
@@ -56,7 +58,7 @@ class MarkdownExporter:
     
     def _generate_overview(self) -> str:
         """Generate overview section."""
-        entry_points = [str(ep.relative_to(self.analysis.root_path)) for ep in self.analysis.entry_points]
+        entry_points = [self.context.rel(ep) for ep in self.analysis.entry_points]
         entry_points_str = ', '.join(entry_points) if entry_points else 'None detected'
         
         languages_badges = ' '.join(f'`{lang}`' for lang in sorted(self.analysis.languages))
@@ -76,9 +78,10 @@ This codebase contains {self.analysis.total_files} files across {len(self.analys
     
     def _generate_architecture(self) -> str:
         """Generate architecture section."""
-        function_count = len([s for s in self.analysis.symbols if s.type == 'function'])
-        class_count = len([s for s in self.analysis.symbols if s.type == 'class'])
-        method_count = len([s for s in self.analysis.symbols if s.type == 'method'])
+        counts = self.context.counts_by_type
+        function_count = counts.get('function', 0)
+        class_count = counts.get('class', 0)
+        method_count = counts.get('method', 0)
         
         return f"""## 🧱 Architecture
 
@@ -103,128 +106,143 @@ The codebase follows a modular architecture with {len(self.analysis.symbols)} de
 ```
 """
     
-    def _render_directory_tree(self, tree: Dict, prefix: str = "") -> str:
+    def _render_directory_tree(self, tree: Dict) -> str:
         """Render directory tree as Markdown."""
-        if not tree:
-            return ""
-        
         lines = []
-        items = list(tree.items())
-        
-        for i, (key, value) in enumerate(items):
-            is_last = i == len(items) - 1
-            current_prefix = "└── " if is_last else "├── "
-            
-            if key == '_files':
-                for j, file in enumerate(value):
-                    file_is_last = j == len(value) - 1
-                    file_prefix = "└── " if file_is_last else "├── "
-                    lines.append(f"{prefix}{'    ' if is_last else '│   '}{file_prefix}{file}")
-            else:
-                lines.append(f"{prefix}{current_prefix}{key}/")
-                if isinstance(value, dict):
-                    next_prefix = prefix + ("    " if is_last else "│   ")
-                    lines.append(self._render_directory_tree(value, next_prefix))
-        
-        return "\n".join(filter(None, lines))
+        # Depth-first walk; each stack entry is a finished line plus the
+        # subtree (and its prefix) to expand right after it
+        stack = []
+        
+        def push_children(node: Dict, prefix: str) -> None:
+            entries = []
+            items = list(node.items())
+            for i, (key, value) in enumerate(items):
+                is_last = i == len(items) - 1
+                
+                if key == '_files':
+                    file_indent = prefix + ('    ' if is_last else '│   ')
+                    for j, file in enumerate(value):
+                        file_prefix = "└── " if j == len(value) - 1 else "├── "
+                        entries.append((f"{file_indent}{file_prefix}{file}", None, ""))
+                else:
+                    current_prefix = "└── " if is_last else "├── "
+                    subtree = value if isinstance(value, dict) else None
+                    entries.append((f"{prefix}{current_prefix}{key}/", subtree,
+                                    prefix + ("    " if is_last else "│   ")))
+            stack.extend(reversed(entries))
+        
+        push_children(tree, "")
+        while stack:
+            line, subtree, next_prefix = stack.pop()
+            lines.append(line)
+            if subtree:
+                push_children(subtree, next_prefix)
+        
+        return "\n".join(lines)
     
     def _generate_key_components(self) -> str:
         """Generate key components section."""
         if not self.analysis.symbols:
             return "## 🔧 Key Components\n\nNo components detected."
         
-        # Group by type
-        functions = [s for s in self.analysis.symbols if s.type == 'function'][:10]
-        classes = [s for s in self.analysis.symbols if s.type == 'class'][:10]
+        functions, classes = self._top_components
         
-        content = "## 🔧 Key Components\n\n"
+        parts = ["## 🔧 Key Components\n\n"]
         
         if functions:
-            content += "### Functions\n"
+            parts.append("### Functions\n")
             for func in functions:
-                rel_path = func.file_path.relative_to(self.analysis.root_path)
-                content += f"- `{func.name}()` - {rel_path}:{func.line_number}\n"
-            content += "\n"
+                parts.append(f"- `{func.name}()` - {self.context.rel(func.file_path)}:{func.line_number}\n")
+            parts.append("\n")
         
         if classes:
-            content += "### Classes\n"
+            parts.append("### Classes\n")
             for cls in classes:
-                rel_path = cls.file_path.relative_to(self.analysis.root_path)
-                content += f"- `{cls.name}` - {rel_path}:{cls.line_number}\n"
-            content += "\n"
+                parts.append(f"- `{cls.name}` - {self.context.rel(cls.file_path)}:{cls.line_number}\n")
+            parts.append("\n")
         
-        return content
+        return "".join(parts)
+    
+    @cached_property
+    def _top_components(self) -> Tuple[List, List]:
+        """First 10 functions and first 10 classes, found in one pass."""
+        functions, classes = [], []
+        for s in self.analysis.symbols:
+            if s.type == 'function':
+                if len(functions) < 10:
+                    functions.append(s)
+            elif s.type == 'class':
+                if len(classes) < 10:
+                    classes.append(s)
+            else:
+                continue
+            if len(functions) == 10 and len(classes) == 10:
+                break
+        return functions, classes
     
     def _generate_core_logic(self) -> str:
         """Generate core logic section."""
         if not self.analysis.execution_flows:
             return "## ⚡ Core Logic\n\nNo execution flows detected."
         
-        content = f"## ⚡ Core Logic\n\nIdentified {len(self.analysis.execution_flows)} execution flows:\n\n"
+        parts = [f"## ⚡ Core Logic\n\nIdentified {len(self.analysis.execution_flows)} execution flows:\n\n"]
         
         for flow in self.analysis.execution_flows:
-            content += f"### {flow.name}\n"
-            content += f"{flow.description}\n\n"
+            parts.append(f"### {flow.name}\n{flow.description}\n\n")
             
             if flow.steps:
                 steps_str = " → ".join(flow.steps[:5])
                 if len(flow.steps) > 5:
                     steps_str += f" ... (+{len(flow.steps) - 5} more)"
-                content += f"```\n{steps_str}\n```\n\n"
+                parts.append(f"```\n{steps_str}\n```\n\n")
         
-        return content
+        return "".join(parts)
     
     def _generate_dependencies(self) -> str:
         """Generate dependencies section."""
         if not self.analysis.imports:
             return "## 📦 Dependencies\n\nNo imports detected."
         
-        # Group imports by module
-        import_counts = {}
-        for imp in self.analysis.imports:
-            if imp.module not in import_counts:
-                import_counts[imp.module] = 0
-            import_counts[imp.module] += 1
-        
-        # Sort by frequency
-        top_imports = sorted(import_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Most imported modules first
+        top_imports = self.context.top_imports
         
-        content = "## 📦 Dependencies\n\n### Top Imported Modules\n\n"
-        content += "| Module | Import Count |\n"
-        content += "|--------|-------------|\n"
+        parts = [
+            "## 📦 Dependencies\n\n### Top Imported Modules\n\n",
+            "| Module | Import Count |\n",
+            "|--------|-------------|\n",
+        ]
+        parts.extend(f"| `{module}` | {count} |\n" for module, count in top_imports)
+        parts.append("\n")
         
-        for module, count in top_imports:
-            content += f"| `{module}` | {count} |\n"
-        
-        return content + "\n"
+        return "".join(parts)
     
     def _generate_data_flow(self) -> str:
         """Generate data flow section."""
         if not self.analysis.domain_entities:
             return "## 🔄 Data Flow\n\nNo domain entities detected."
         
-        content = f"## 🔄 Data Flow\n\nIdentified {len(self.analysis.domain_entities)} domain entities:\n\n"
+        parts = [f"## 🔄 Data Flow\n\nIdentified {len(self.analysis.domain_entities)} domain entities:\n\n"]
         
         for entity in self.analysis.domain_entities:
-            content += f"### {entity.name}\n"
-            content += f"- **Type:** {entity.type}\n"
-            content += f"- **File:** {entity.file_path.relative_to(self.analysis.root_path)}\n"
+            parts.append(f"### {entity.name}\n")
+            parts.append(f"- **Type:** {entity.type}\n")
+            parts.append(f"- **File:** {self.context.rel(entity.file_path)}\n")
             
             if entity.fields:
                 fields_str = ", ".join(entity.fields[:5])
                 if len(entity.fields) > 5:
                     fields_str += f" ... (+{len(entity.fields) - 5} more)"
-                content += f"- **Fields:** {fields_str}\n"
+                parts.append(f"- **Fields:** {fields_str}\n")
             
             if entity.methods:
                 methods_str = ", ".join(entity.methods[:3])
                 if len(entity.methods) > 3:
                     methods_str += f" ... (+{len(entity.methods) - 3} more)"
-                content += f"- **Methods:** {methods_str}\n"
+                parts.append(f"- **Methods:** {methods_str}\n")
             
-            content += "\n"
+            parts.append("\n")
         
-        return content
+        return "".join(parts)
     
     def _generate_risks(self) -> str:
         """Generate risks and technical debt section."""
@@ -239,15 +257,15 @@ The codebase follows a modular architecture with {len(self.analysis.symbols)} de
         if len(self.analysis.execution_flows) < 2:
             risks.append("Limited execution flows detected - may indicate incomplete analysis or simple codebase")
         
-        content = "## ⚠️ Known Issues\n\n"
+        parts = ["## ⚠️ Known Issues\n\n"]
         
         if risks:
-            for risk in risks:
-                content += f"- {risk}\n"
+            parts.extend(f"- {risk}\n" for risk in risks)
         else:
-            content += "No significant risks detected in the current analysis.\n"
+            parts.append("No significant risks detected in the current analysis.\n")
+        parts.append("\n")
         
-        return content + "\n"
+        return "".join(parts)
     
     def _generate_recommendations(self) -> str:
         """Generate recommendations section."""
@@ -265,9 +283,7 @@ The codebase follows a modular architecture with {len(self.analysis.symbols)} de
         recommendations.append("Add comprehensive unit tests for core business logic")
         recommendations.append("Consider implementing code documentation standards")
         
-        content = "## 💡 Recommendations\n\n"
-        
-        for i, rec in enumerate(recommendations, 1):
-            content += f"{i}. {rec}\n"
+        parts = ["## 💡 Recommendations\n\n"]
+        parts.extend(f"{i}. {rec}\n" for i, rec in enumerate(recommendations, 1))
         
-        return content
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
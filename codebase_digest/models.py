@@ -1,7 +1,8 @@
 """Core data models for codebase analysis."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 from pathlib import Path
 
 
@@ -16,6 +17,21 @@ class Symbol:
     parameters: List[str] = field(default_factory=list)
     return_type: Optional[str] = None
     decorators: List[str] = field(default_factory=list)
+    
+    # str(file_path), computed once for serializers
+    file_path_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Few distinct values, compared constantly: interned, `==` against
+        # a literal is usually an identity check
+        self.type = sys.intern(self.type)
+        self.file_path_str = str(self.file_path)
+    
+    def __setstate__(self, state):
+        # Symbols come back from parser worker processes by unpickling,
+        # which bypasses __init__
+        self.__dict__.update(state)
+        self.__post_init__()
 
 
 @dataclass
@@ -26,6 +42,18 @@ class Import:
     alias: Optional[str] = None
     file_path: Optional[Path] = None
     line_number: Optional[int] = None
+    
+    # str(file_path), or None without a file, computed once for serializers
+    file_path_str: Optional[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Interned so counting by module hashes and compares by identity
+        self.module = sys.intern(self.module)
+        self.file_path_str = str(self.file_path) if self.file_path else None
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__post_init__()
 
 
 @dataclass
@@ -48,6 +76,12 @@ class DomainEntity:
     creation_points: List[str] = field(default_factory=list)
     modification_points: List[str] = field(default_factory=list)
     validation_points: List[str] = field(default_factory=list)
+    
+    # str(file_path), computed once for serializers
+    file_path_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.file_path_str = str(self.file_path)
 
 
 @dataclass
@@ -70,6 +104,7 @@ class CodebaseAnalysis:
     domain_entities: List[DomainEntity] = field(default_factory=list)
     execution_flows: List[ExecutionFlow] = field(default_factory=list)
     entry_points: List[Path] = field(default_factory=list)
+    parse_errors: List[Tuple[Path, str]] = field(default_factory=list)
     
     # Metrics
     total_files: int = 0
@@ -78,4 +113,24 @@ class CodebaseAnalysis:
     complexity_score: float = 0.0
     
     # Directory structure
-    directory_tree: Dict = field(default_factory=dict)
\ No newline at end of file
+    directory_tree: Dict = field(default_factory=dict)
+    
+    # Per-symbol attribute arrays, parallel to `symbols` (see index_symbols)
+    _symbol_names: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _symbol_decorators: List[FrozenSet[str]] = field(default_factory=list, init=False, repr=False, compare=False)
+    # The list object the arrays were built from, to detect a replaced `symbols`
+    _indexed_symbols: Optional[List[Symbol]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def index_symbols(self) -> None:
+        """Cache symbol names and decorators as flat, parallel lists.
+        
+        Analyzers iterate these instead of touching every Symbol object.
+        Call again whenever `symbols` changes.
+        """
+        self._symbol_names = [symbol.name for symbol in self.symbols]
+        self._symbol_decorators = [frozenset(symbol.decorators) for symbol in self.symbols]
+        self._indexed_symbols = self.symbols
+    
+    def symbols_indexed(self) -> bool:
+        """Whether the cached arrays still describe the current `symbols`."""
+        return self._indexed_symbols is self.symbols and len(self._symbol_names) == len(self.symbols)